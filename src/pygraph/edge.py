@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Edge[V: Hashable]:
     """Represents an edge in a graph with weight and metadata.
 
@@ -31,6 +31,9 @@ class Edge[V: Hashable]:
     from equality/hash comparison, modifying it won't affect the edge's behavior
     in sets or as dictionary keys.
 
+    The dataclass uses ``__slots__``, so instances carry no per-instance
+    ``__dict__``; this keeps large edge sets compact.
+
     Args:
         source: The source vertex (must be hashable and comparable for undirected edges)
         target: The target vertex (must be hashable and comparable for undirected edges)
@@ -19,6 +19,8 @@ from collections.abc import Hashable
 from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pygraph.edge import Edge
 
 # pylint: disable=wrong-import-position
@@ -147,6 +149,34 @@ class Graph[V: Hashable]:
         self._validate_vertex_hashable(vertex)
         self._repr.add_vertex(vertex)
 
+    def add_vertices(self, vertices: Iterable[V]) -> None:
+        """Add several vertices to the graph in one batch.
+
+        Equivalent to calling add_vertex() for each vertex, but lets the
+        representation grow its storage once for the whole batch. Vertices
+        already in the graph are ignored. All vertices are validated before
+        any is added, so a failure leaves the graph unchanged.
+
+        Args:
+            vertices: The vertices to add (each must be hashable)
+
+        Raises:
+            TypeError: If any vertex is not hashable
+
+        Examples:
+            >>> graph = Graph[str]()
+            >>> graph.add_vertices(["A", "B", "C"])
+            >>> sorted(graph.vertices())
+            ['A', 'B', 'C']
+            >>> graph.add_vertices(["C", "D"])  # Existing vertices are ignored
+            >>> graph.num_vertices()
+            4
+        """
+        batch = list(vertices)
+        for vertex in batch:
+            self._validate_vertex_hashable(vertex)
+        self._repr.add_vertices(batch)
+
     def remove_vertex(self, vertex: V) -> None:
         """Remove a vertex from the graph.
 
@@ -251,7 +281,8 @@ class Graph[V: Hashable]:
         """Get all vertices in the graph.
 
         Returns:
-            Set of all vertices in the graph
+            A new set of all vertices in the graph. It is a snapshot, so the
+            graph can be modified while iterating over it.
 
         Examples:
             >>> graph = Graph[str]()
@@ -262,7 +293,7 @@ class Graph[V: Hashable]:
             >>> sorted(graph.vertices())
             ['A', 'B']
         """
-        return self._repr.get_vertices()
+        return set(self._repr.get_vertices())
 
     def has_vertex(self, vertex: V) -> bool:
         """Check if a vertex exists in the graph.
@@ -325,7 +356,7 @@ class Graph[V: Hashable]:
             >>> graph.num_vertices()
             1
         """
-        return len(self.vertices())
+        return len(self._repr.get_vertices())
 
     def num_edges(self) -> int:
         """Get the number of edges in the graph.
@@ -333,7 +364,7 @@ class Graph[V: Hashable]:
         Returns:
             Number of edges in the graph
         """
-        return len(self.edges())
+        return self._repr.count_edges()
 
     # Edge Operations
 
@@ -391,6 +422,34 @@ class Graph[V: Hashable]:
         # Add edge through representation (handles idempotency)
         self._repr.add_edge(source, target, weight, metadata or {})
 
+    def add_edges(self, edges: Iterable[tuple[V, V] | tuple[V, V, float]]) -> None:
+        """Add several edges to the graph in one batch.
+
+        Each edge is a (source, target) or (source, target, weight) tuple.
+        Existing edges are ignored, as with add_edge(). All endpoints are
+        validated before any edge is added, so a failure leaves the graph
+        unchanged.
+
+        Args:
+            edges: The edges to add
+
+        Raises:
+            VertexNotFoundError: If any source or target vertex is not in the graph
+
+        Examples:
+            >>> graph = Graph[str](directed=True)
+            >>> graph.add_vertices(["A", "B", "C"])
+            >>> graph.add_edges([("A", "B"), ("B", "C", 2.5)])
+            >>> graph.num_edges()
+            2
+            >>> graph.get_edge("B", "C").weight
+            2.5
+        """
+        batch = list(edges)
+        for edge in batch:
+            self._validate_edge_vertices(edge[0], edge[1], "edge addition")
+        self._repr.add_edges(batch)
+
     def remove_edge(self, source: V, target: V) -> None:
         """Remove an edge from the graph.
 
@@ -747,7 +806,7 @@ class Graph[V: Hashable]:
             >>> single.is_connected()
             True
         """
-        vertices = self.vertices()
+        vertices = self._repr.get_vertices()
 
         # Empty graph or single vertex is considered connected
         if len(vertices) <= 1:
@@ -846,7 +905,7 @@ class Graph[V: Hashable]:
             return False
 
         # Start DFS from all unvisited vertices
-        for vertex in self.vertices():  # noqa: SIM110
+        for vertex in self._repr.get_vertices():  # noqa: SIM110
             if vertex not in visited_global and dfs(vertex):
                 return True
 
@@ -875,7 +934,7 @@ class Graph[V: Hashable]:
             return False
 
         # Start DFS from all unvisited vertices (handles disconnected graphs)
-        for vertex in self.vertices():  # noqa: SIM110
+        for vertex in self._repr.get_vertices():  # noqa: SIM110
             if vertex not in visited and dfs(vertex, None):
                 return True
 
@@ -926,7 +985,7 @@ class Graph[V: Hashable]:
             return
 
         # Capture current graph data
-        vertices = self.vertices().copy()
+        vertices = self.vertices()
         edges = self.edges().copy()
 
         # Convert to target representation
@@ -948,6 +1007,26 @@ class Graph[V: Hashable]:
         # Update representation attribute
         self._representation = target
 
+    def reorder_rcm(self) -> None:
+        """Reorder the internal vertex storage for traversal locality.
+
+        Applies a Reverse Cuthill-McKee ordering to the representation, so
+        adjacent vertices are stored close together. This is most useful once
+        after a bulk load, before running many traversals. Vertices, edges,
+        weights and metadata are unchanged; only iteration order may differ.
+
+        Examples:
+            >>> graph = Graph[int](representation="adjacency_matrix")
+            >>> graph.add_vertices([0, 1, 2, 3])
+            >>> graph.add_edges([(0, 3), (3, 1), (1, 2)])
+            >>> graph.reorder_rcm()
+            >>> graph.has_edge(3, 1)
+            True
+            >>> graph.num_edges()
+            3
+        """
+        self._repr.reorder_rcm()
+
     # Protocol Implementation
 
     def to_graph(self) -> Graph[V]:
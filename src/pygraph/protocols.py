@@ -26,7 +26,7 @@ Example:
     ...     pass
 """
 
-from collections.abc import Hashable
+from collections.abc import Hashable, Set
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -59,11 +59,11 @@ class GraphLike[V: Hashable](Protocol):
         ...             print(f"  -> {neighbor}")
     """
 
-    def vertices(self) -> set[V]:
+    def vertices(self) -> Set[V]:
         """Get all vertices in the structure.
 
         Returns:
-            A set containing all vertices in the graph-like structure.
+            A set-like collection containing all vertices in the graph-like structure.
         """
 
     def edges(self) -> set[tuple[V, V]]:
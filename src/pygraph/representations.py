@@ -7,11 +7,17 @@ handle the low-level storage and manipulation of graph data.
 
 from __future__ import annotations
 
-from collections.abc import Hashable
+from collections import deque
+from collections.abc import Hashable, Iterable, KeysView
+from itertools import compress
 from typing import Any, Protocol
 
 from pygraph.edge import Edge
 
+# Shared empty adjacency used as the lookup default for missing vertices, so edge
+# queries need a single dict lookup per endpoint. Never mutated.
+_NO_NEIGHBORS: dict[Any, Any] = {}
+
 
 class GraphRepresentation[V: Hashable](Protocol):
     """Protocol defining the interface for graph representations."""
@@ -19,12 +25,18 @@ class GraphRepresentation[V: Hashable](Protocol):
     def add_vertex(self, vertex: V) -> bool:
         """Add a vertex. Returns True if added, False if already exists."""
 
+    def add_vertices(self, vertices: Iterable[V]) -> int:
+        """Add several vertices. Returns the number of vertices added."""
+
     def remove_vertex(self, vertex: V) -> bool:
         """Remove a vertex and its edges. Returns True if removed."""
 
     def add_edge(self, source: V, target: V, weight: float = 1.0, metadata: dict[str, Any] | None = None) -> bool:
         """Add an edge. Returns True if added, False if already exists."""
 
+    def add_edges(self, edges: Iterable[tuple[V, V] | tuple[V, V, float]]) -> int:
+        """Add several (source, target[, weight]) edges. Returns the number of edges added."""
+
     def remove_edge(self, source: V, target: V) -> bool:
         """Remove an edge. Returns True if removed."""
 
@@ -34,18 +46,59 @@ class GraphRepresentation[V: Hashable](Protocol):
     def has_edge(self, source: V, target: V) -> bool:
         """Check if edge exists."""
 
-    def get_vertices(self) -> set[V]:
-        """Get all vertices."""
+    def get_vertices(self) -> KeysView[V]:
+        """Get a read-only, set-like view of all vertices."""
 
     def get_edges(self) -> set[Edge[V]]:
         """Get all edges."""
 
+    def count_edges(self) -> int:
+        """Count edges without building them. Undirected edges count once."""
+
     def get_neighbors(self, vertex: V) -> set[V]:
         """Get adjacent vertices."""
 
     def get_edge_data(self, source: V, target: V) -> Edge[V] | None:
         """Get edge data if edge exists."""
 
+    def reorder_rcm(self) -> None:
+        """Reorder vertex storage in Reverse Cuthill-McKee order. The graph is unchanged."""
+
+
+def _reverse_cuthill_mckee(adjacency: list[set[int]]) -> list[int]:
+    """Compute a Reverse Cuthill-McKee ordering of vertices ``0..n-1``.
+
+    ``adjacency[i]`` must hold the neighbours of ``i`` with edges treated as
+    undirected. Each connected component is traversed breadth-first from its
+    lowest-degree vertex, visiting neighbours in increasing degree order; the
+    concatenated order is then reversed. Placing adjacent vertices at nearby
+    indices reduces the bandwidth of the adjacency matrix.
+
+    Returns:
+        A permutation where position ``i`` holds the old index of the vertex
+        that should move to index ``i``.
+    """
+    n = len(adjacency)
+    degree = [len(neighbors) for neighbors in adjacency]
+    visited = bytearray(n)
+    order: list[int] = []
+
+    for start in sorted(range(n), key=degree.__getitem__):
+        if visited[start]:
+            continue
+        visited[start] = 1
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            order.append(current)
+            for neighbor in sorted(adjacency[current], key=degree.__getitem__):
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+
+    order.reverse()
+    return order
+
 
 class AdjacencyList[V: Hashable]:
     """Adjacency list representation using dictionaries.
@@ -79,6 +132,16 @@ class AdjacencyList[V: Hashable]:
         self._adj[vertex] = {}
         return True
 
+    def add_vertices(self, vertices: Iterable[V]) -> int:
+        """Add several vertices. Returns the number of vertices added.
+
+        New vertices are collected into a single dict and merged with one
+        update, so the adjacency dict is resized at most once per batch.
+        """
+        new: dict[V, dict[V, Edge[V]]] = {vertex: {} for vertex in vertices if vertex not in self._adj}
+        self._adj.update(new)
+        return len(new)
+
     def remove_vertex(self, vertex: V) -> bool:
         """Remove a vertex and its edges. Returns True if removed."""
         if vertex not in self._adj:
@@ -113,6 +176,10 @@ class AdjacencyList[V: Hashable]:
 
         return True
 
+    def add_edges(self, edges: Iterable[tuple[V, V] | tuple[V, V, float]]) -> int:
+        """Add several (source, target[, weight]) edges. Returns the number of edges added."""
+        return sum(self.add_edge(*edge) for edge in edges)
+
     def remove_edge(self, source: V, target: V) -> bool:
         """Remove an edge. Returns True if removed."""
         if source not in self._adj or target not in self._adj[source]:
@@ -132,11 +199,11 @@ class AdjacencyList[V: Hashable]:
 
     def has_edge(self, source: V, target: V) -> bool:
         """Check if edge exists."""
-        return source in self._adj and target in self._adj[source]
+        return target in self._adj.get(source, _NO_NEIGHBORS)
 
-    def get_vertices(self) -> set[V]:
-        """Get all vertices."""
-        return set(self._adj.keys())
+    def get_vertices(self) -> KeysView[V]:
+        """Get a read-only, set-like view of all vertices (no copy is made)."""
+        return self._adj.keys()
 
     def get_edges(self) -> set[Edge[V]]:
         """Get all edges."""
@@ -146,6 +213,15 @@ class AdjacencyList[V: Hashable]:
                 edges.add(edge)
         return edges
 
+    def count_edges(self) -> int:
+        """Count edges without building them. Undirected edges count once."""
+        stored = sum(map(len, self._adj.values()))
+        if self._directed:
+            return stored
+        # Undirected edges are stored in both directions, except self-loops
+        loops = sum(vertex in neighbors for vertex, neighbors in self._adj.items())
+        return (stored + loops) // 2
+
     def get_neighbors(self, vertex: V) -> set[V]:
         """Get adjacent vertices."""
         if vertex not in self._adj:
@@ -154,9 +230,30 @@ class AdjacencyList[V: Hashable]:
 
     def get_edge_data(self, source: V, target: V) -> Edge[V] | None:
         """Get edge data if edge exists."""
-        if source in self._adj and target in self._adj[source]:
-            return self._adj[source][target]
-        return None
+        return self._adj.get(source, _NO_NEIGHBORS).get(target)
+
+    def reorder_rcm(self) -> None:
+        """Reorder vertices using Reverse Cuthill-McKee for traversal locality.
+
+        The adjacency dicts are rebuilt in RCM order, so iteration over
+        vertices and neighbours visits adjacent vertices close together.
+        The graph itself is unchanged.
+        """
+        vertices = list(self._adj)
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        adjacency: list[set[int]] = [set() for _ in vertices]
+        for i, neighbors in enumerate(self._adj.values()):
+            for neighbor in neighbors:
+                j = index[neighbor]
+                adjacency[i].add(j)
+                adjacency[j].add(i)
+
+        order = _reverse_cuthill_mckee(adjacency)
+        position = {vertices[old]: new for new, old in enumerate(order)}
+        self._adj = {
+            vertices[old]: dict(sorted(self._adj[vertices[old]].items(), key=lambda item: position[item[0]]))
+            for old in order
+        }
 
 
 class AdjacencyMatrix[V: Hashable]:
@@ -202,6 +299,29 @@ class AdjacencyMatrix[V: Hashable]:
 
         return True
 
+    def add_vertices(self, vertices: Iterable[V]) -> int:
+        """Add several vertices. Returns the number of vertices added.
+
+        The matrix is grown once for the whole batch rather than once per vertex.
+        """
+        new = [vertex for vertex in dict.fromkeys(vertices) if vertex not in self._vertex_to_index]
+        if not new:
+            return 0
+
+        start = len(self._vertex_to_index)
+        for index, vertex in enumerate(new, start):
+            self._vertex_to_index[vertex] = index
+            self._index_to_vertex[index] = vertex
+
+        # Resize matrix
+        size = start + len(new)
+        padding: list[Edge[V] | None] = [None] * len(new)
+        for row in self._matrix:
+            row.extend(padding)
+        self._matrix.extend([None] * size for _ in new)
+
+        return len(new)
+
     def remove_vertex(self, vertex: V) -> bool:
         """Remove a vertex and its edges. Returns True if removed."""
         if vertex not in self._vertex_to_index:
@@ -251,6 +371,10 @@ class AdjacencyMatrix[V: Hashable]:
 
         return True
 
+    def add_edges(self, edges: Iterable[tuple[V, V] | tuple[V, V, float]]) -> int:
+        """Add several (source, target[, weight]) edges. Returns the number of edges added."""
+        return sum(self.add_edge(*edge) for edge in edges)
+
     def remove_edge(self, source: V, target: V) -> bool:
         """Remove an edge. Returns True if removed."""
         if source not in self._vertex_to_index or target not in self._vertex_to_index:
@@ -276,16 +400,16 @@ class AdjacencyMatrix[V: Hashable]:
 
     def has_edge(self, source: V, target: V) -> bool:
         """Check if edge exists."""
-        if source not in self._vertex_to_index or target not in self._vertex_to_index:
+        # One lookup per endpoint instead of a membership test plus a subscript
+        source_idx = self._vertex_to_index.get(source)
+        target_idx = self._vertex_to_index.get(target)
+        if source_idx is None or target_idx is None:
             return False
-
-        source_idx = self._vertex_to_index[source]
-        target_idx = self._vertex_to_index[target]
         return self._matrix[source_idx][target_idx] is not None
 
-    def get_vertices(self) -> set[V]:
-        """Get all vertices."""
-        return set(self._vertex_to_index.keys())
+    def get_vertices(self) -> KeysView[V]:
+        """Get a read-only, set-like view of all vertices (no copy is made)."""
+        return self._vertex_to_index.keys()
 
     def get_edges(self) -> set[Edge[V]]:
         """Get all edges."""
@@ -296,24 +420,49 @@ class AdjacencyMatrix[V: Hashable]:
                     edges.add(edge)
         return edges
 
+    def count_edges(self) -> int:
+        """Count edges without building them. Undirected edges count once."""
+        stored = sum(len(row) - row.count(None) for row in self._matrix)
+        if self._directed:
+            return stored
+        # Undirected edges are stored in both directions, except self-loops on the diagonal
+        loops = sum(row[index] is not None for index, row in enumerate(self._matrix))
+        return (stored + loops) // 2
+
     def get_neighbors(self, vertex: V) -> set[V]:
         """Get adjacent vertices."""
-        if vertex not in self._vertex_to_index:
+        source_idx = self._vertex_to_index.get(vertex)
+        if source_idx is None:
             return set()
 
-        neighbors = set()
-        source_idx = self._vertex_to_index[vertex]
-        for target_idx, edge in enumerate(self._matrix[source_idx]):
-            if edge is not None:
-                neighbors.add(self._index_to_vertex[target_idx])
-
-        return neighbors
+        # Scan the row in C: compress() keeps the indices of non-None cells (Edge
+        # instances are always truthy), and only those are mapped back to vertices.
+        # Undirected edges are stored in both rows, so no column scan is needed.
+        row = self._matrix[source_idx]
+        return set(map(self._index_to_vertex.__getitem__, compress(range(len(row)), row)))
 
     def get_edge_data(self, source: V, target: V) -> Edge[V] | None:
         """Get edge data if edge exists."""
-        if source not in self._vertex_to_index or target not in self._vertex_to_index:
+        source_idx = self._vertex_to_index.get(source)
+        target_idx = self._vertex_to_index.get(target)
+        if source_idx is None or target_idx is None:
             return None
-
-        source_idx = self._vertex_to_index[source]
-        target_idx = self._vertex_to_index[target]
         return self._matrix[source_idx][target_idx]
+
+    def reorder_rcm(self) -> None:
+        """Reorder vertex indices using Reverse Cuthill-McKee to reduce bandwidth.
+
+        Rows and columns of the matrix are permuted so that edges cluster
+        near the diagonal, which improves cache locality for traversals
+        after a bulk load. The graph itself is unchanged.
+        """
+        adjacency: list[set[int]] = [set() for _ in self._matrix]
+        for i, row in enumerate(self._matrix):
+            for j in compress(range(len(row)), row):
+                adjacency[i].add(j)
+                adjacency[j].add(i)
+
+        order = _reverse_cuthill_mckee(adjacency)
+        self._matrix = [[self._matrix[i][j] for j in order] for i in order]
+        self._index_to_vertex = {new: self._index_to_vertex[old] for new, old in enumerate(order)}
+        self._vertex_to_index = {vertex: index for index, vertex in self._index_to_vertex.items()}
@@ -8,7 +8,7 @@ on both Graph and Tree structures.
 Key features:
 - Trees are represented as directed acyclic graphs
 - Single root vertex with parent-child relationships
-- O(1) parent lookups using _parent_map
+- O(1) parent and children lookups using _parent_map and _children_map
 - Implements GraphLike protocol for algorithm compatibility
 - Enforces tree constraints (acyclic, connected, single root)
 
@@ -24,8 +24,9 @@ Example:
 
 from __future__ import annotations
 
-from collections import deque
-from collections.abc import Hashable
+import sys
+from collections.abc import Hashable, Iterable, Iterator, KeysView
+from typing import cast
 
 from pygraph.exceptions import CycleError, InvalidGraphError, VertexNotFoundError
 from pygraph.graph import Graph
@@ -58,6 +59,19 @@ class Tree[V: Hashable]:
         {'B', 'C'}
     """
 
+    # No per-instance __dict__: smaller trees and faster attribute access in the hot paths
+    __slots__ = (
+        "_root",
+        "_graph",
+        "_parent_map",
+        "_children_map",
+        "_depth_map",
+        "_edges",
+        "_num_vertices",
+        "_num_edges",
+        "_height_cache",
+    )
+
     def __init__(self, root: V) -> None:
         """Initialize a tree with a root vertex.
 
@@ -76,10 +90,17 @@ class Tree[V: Hashable]:
             >>> tree.num_edges()
             0
         """
+        root = Tree._intern_vertex(root)
         self._root = root
         self._graph = Graph[V](directed=True, weighted=False)
         self._graph.add_vertex(root)
         self._parent_map: dict[V, V] = {}  # Maps child -> parent for O(1) lookups
+        self._children_map: dict[V, set[V]] = {root: set()}  # Maps every vertex -> its children
+        self._depth_map: dict[V, int] = {root: 0}  # Maps every vertex -> its distance from the root
+        self._edges: set[tuple[V, V]] = set()  # (parent, child) pairs for O(1) has_edge
+        self._num_vertices = 1  # Cached counts so num_vertices()/num_edges() are O(1)
+        self._num_edges = 0
+        self._height_cache: int | None = 0  # Cached height(); None when it must be recomputed
 
     @property
     def root(self) -> V:
@@ -119,32 +140,213 @@ class Tree[V: Hashable]:
             >>> tree.children("A")
             {'B', 'C'}
         """
-        if not self._graph.has_vertex(parent):
-            raise VertexNotFoundError(f"Parent vertex {parent} does not exist in tree")
-
-        # Check if child already exists - in a tree, each vertex has exactly one parent
-        if self._graph.has_vertex(child):
-            # Check if this is a duplicate operation (same parent-child relationship)
-            if child in self._graph.neighbors(parent):
-                # This is a duplicate - child is already a child of this parent
-                raise ValueError(f"Child vertex {child} already exists in tree")
-            # Child exists but with a different parent - this would create a cycle
-            # because the child already has a parent in the tree
-            raise CycleError(f"Adding edge ({parent}, {child}) would create a cycle in tree")
+        parent = Tree._intern_vertex(parent)
+        try:
+            siblings = self._children_map[parent]
+        except KeyError:
+            raise VertexNotFoundError(f"Parent vertex {parent} does not exist in tree") from None
+
+        # In a tree each vertex has exactly one parent, so a new child can never close a cycle;
+        # only an existing child needs the error classification
+        if child in self._children_map:
+            raise self._existing_child_error(parent, child)
 
         # Add vertex and edge
+        child = Tree._intern_vertex(child)
         self._graph.add_vertex(child)
         self._graph.add_edge(parent, child)
 
-        # Update parent map
+        # Update parent/children maps and cached counts
         self._parent_map[child] = parent
+        self._edges.add((parent, child))
+        siblings.add(child)
+        self._children_map[child] = set()
+        depth = self._depth_map[parent] + 1
+        self._depth_map[child] = depth
+        self._num_vertices += 1
+        self._num_edges += 1
+
+        # A new leaf can only raise the height, so the cache stays valid
+        if self._height_cache is not None and depth > self._height_cache:
+            self._height_cache = depth
+
+    def bulk_add_children(self, edges: Iterable[tuple[V, V]]) -> None:
+        """Add many (parent, child) edges in one call.
+
+        Edges are applied in order, so a child added earlier in the batch can
+        be the parent of a later edge. If any edge is rejected, the edges
+        already applied from the batch are rolled back, so nothing is added.
+
+        Args:
+            edges: Iterable of (parent, child) pairs
+
+        Raises:
+            VertexNotFoundError: If a parent is neither in the tree nor added
+                earlier in the batch
+            ValueError: If an edge duplicates an existing parent-child relationship
+            CycleError: If a child already exists with a different parent
+
+        Example:
+            >>> tree = Tree("A")
+            >>> tree.bulk_add_children([("A", "B"), ("A", "C"), ("B", "D")])
+            >>> tree.num_vertices()
+            4
+            >>> tree.depth("D")
+            2
+        """
+        parent_map = self._parent_map
+        children_map = self._children_map
+        depth_map = self._depth_map
+
+        # Each accepted edge is written straight into the maps, so later edges in the
+        # batch validate against it with the same lookups as the existing tree
+        added: list[tuple[V, V]] = []
+        max_depth = 0
+        try:
+            for parent, child in edges:
+                parent = Tree._intern_vertex(parent)
+                try:
+                    siblings = children_map[parent]
+                except KeyError:
+                    raise VertexNotFoundError(f"Parent vertex {parent} does not exist in tree") from None
+                if child in children_map:
+                    raise self._existing_child_error(parent, child)
+                child = Tree._intern_vertex(child)
+                depth = depth_map[parent] + 1
+                parent_map[child] = parent
+                siblings.add(child)
+                children_map[child] = set()
+                depth_map[child] = depth
+                added.append((parent, child))
+                max_depth = max(max_depth, depth)
+        except BaseException:
+            # Undo in reverse so a child's own entries go before its parent's
+            for parent, child in reversed(added):
+                del parent_map[child]
+                children_map[parent].discard(child)
+                del children_map[child]
+                del depth_map[child]
+            raise
+
+        if not added:
+            return
+
+        self._graph.add_vertices([child for _, child in added])
+        self._graph.add_edges(added)
+        self._edges.update(added)
+        self._num_vertices += len(added)
+        self._num_edges += len(added)
+        if self._height_cache is not None and max_depth > self._height_cache:
+            self._height_cache = max_depth
+
+    @staticmethod
+    def _intern_vertex(vertex: V) -> V:
+        """Intern plain string vertices before they are stored.
+
+        Interned keys let dict lookups with equal interned strings (such as
+        literals) match on identity instead of comparing characters. Both ends
+        of a new edge go through here, so the parent stored in _parent_map and
+        _edges is the same object as its own key. Other vertex types,
+        including str subclasses, are returned unchanged.
+
+        Args:
+            vertex: The vertex about to be stored
+
+        Returns:
+            The interned string if vertex is a str, otherwise vertex itself
+        """
+        if type(vertex) is str:
+            return cast("V", sys.intern(cast("str", vertex)))
+        return vertex
+
+    def _require_vertex(self, vertex: V) -> None:
+        """Raise VertexNotFoundError unless vertex is in the tree.
+
+        Uses a single dict membership test on _children_map, which is keyed
+        by every vertex including the root.
+
+        Args:
+            vertex: The vertex to validate
+
+        Raises:
+            VertexNotFoundError: If vertex doesn't exist in tree
+        """
+        if vertex not in self._children_map:
+            raise VertexNotFoundError(f"Vertex {vertex} does not exist in tree")
+
+    def _existing_child_error(self, parent: V, child: V) -> ValueError | CycleError:
+        """Build the error for attaching child, which is already in the tree, to parent.
+
+        Kept out of add_child so the successful path runs no cycle checks at all.
+
+        Args:
+            parent: The requested parent vertex (must exist in tree)
+            child: The requested child vertex (must exist in tree)
+
+        Returns:
+            ValueError if the edge already exists, otherwise a CycleError
+        """
+        # This is a duplicate - child is already a child of this parent
+        if child in self._children_map[parent]:
+            return ValueError(f"Child vertex {child} already exists in tree")
+        # A back edge to an ancestor (or to parent itself) closes a directed cycle
+        if self._is_ancestor(child, parent):
+            return CycleError(f"Adding edge ({parent}, {child}) would create a cycle in tree")
+        # Otherwise child would get a second parent, which is a cycle in the undirected sense
+        return CycleError(
+            f"Adding edge ({parent}, {child}) would create a cycle in tree: "
+            f"{child} already has parent {self._parent_map[child]}"
+        )
+
+    def _is_ancestor(self, ancestor: V, vertex: V) -> bool:
+        """Check whether ancestor is vertex itself or lies on its path to the root.
+
+        Uses the depth map to bound the parent walk to the depth difference,
+        and to answer False without walking when ancestor is deeper than vertex.
+
+        Args:
+            ancestor: The candidate ancestor (must exist in tree)
+            vertex: The vertex whose ancestors are checked (must exist in tree)
+
+        Returns:
+            True if ancestor is vertex or one of its ancestors, False otherwise
+        """
+        steps = self._depth_map[vertex] - self._depth_map[ancestor]
+        if steps < 0:
+            return False
+
+        current = vertex
+        for _ in range(steps):
+            current = self._parent_map[current]
+        return current == ancestor
+
+    def _iter_descendants(self, vertex: V) -> Iterator[V]:
+        """Yield vertex and all its descendants in depth-first preorder.
+
+        Uses an explicit stack, so deep trees hit no recursion limit, and
+        streams vertices without building an intermediate list. The tree must
+        not be modified while the generator is running.
+
+        Args:
+            vertex: The root of the subtree to walk (must exist in tree)
+
+        Yields:
+            Each vertex of the subtree, parents before their children
+        """
+        children_map = self._children_map
+        stack = [vertex]
+
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(children_map[current])
 
     def remove_subtree(self, node: V) -> None:
         """Remove a node and all its descendants from the tree.
 
-        This method removes the specified node and recursively removes all
-        of its descendants. The parent map is updated to remove entries for
-        all removed nodes.
+        This method removes the specified node and all of its descendants,
+        found with an iterative depth-first traversal (no recursion limit).
+        The parent map is updated to remove entries for all removed nodes.
 
         Args:
             node: The root of the subtree to remove
@@ -160,34 +362,43 @@ class Tree[V: Hashable]:
             >>> tree.num_vertices()
             1
         """
-        if not self._graph.has_vertex(node):
-            raise VertexNotFoundError(f"Vertex {node} does not exist in tree")
+        self._require_vertex(node)
 
-        # Find all descendants using BFS
-        to_remove = []
-        queue = [node]
+        # Materialize the descendants before the maps they are read from are mutated
+        to_remove = list(self._iter_descendants(node))
 
-        while queue:
-            current = queue.pop(0)
-            to_remove.append(current)
+        # Every removed vertex takes its incoming edge with it, except the root which has none
+        self._num_vertices -= len(to_remove)
+        self._num_edges -= len(to_remove) if node in self._parent_map else len(to_remove) - 1
+        self._height_cache = None
 
-            # Add all children to the queue
-            for child in self._graph.neighbors(current):
-                queue.append(child)
+        parent_map = self._parent_map
+        children_map = self._children_map
+        depth_map = self._depth_map
+        tree_edges = self._edges
+        graph = self._graph
 
-        # Remove all nodes and update parent map
+        # Detach the subtree from its parent (the root has none)
+        if node in parent_map:
+            children_map[parent_map[node]].discard(node)
+
+        # Remove all nodes and update parent/children maps
         for vertex in to_remove:
-            # Remove from parent map
-            if vertex in self._parent_map:
-                del self._parent_map[vertex]
+            del children_map[vertex]
+            del depth_map[vertex]
+
+            # Remove from parent map along with the incoming edge
+            if vertex in parent_map:
+                tree_edges.discard((parent_map.pop(vertex), vertex))
 
             # Remove vertex from graph (this also removes its edges)
-            self._graph.remove_vertex(vertex)
+            graph.remove_vertex(vertex)
 
     def parent(self, vertex: V) -> V | None:
         """Get the parent of a vertex.
 
-        Uses the internal parent map for O(1) lookup.
+        Uses the internal parent map for O(1) lookup. Non-root vertices cost a
+        single dict probe; only a miss checks whether vertex is the root.
 
         Args:
             vertex: The vertex to get the parent of
@@ -206,19 +417,25 @@ class Tree[V: Hashable]:
             >>> tree.parent("A") is None
             True
         """
-        if not self._graph.has_vertex(vertex):
-            raise VertexNotFoundError(f"Vertex {vertex} does not exist in tree")
-
-        return self._parent_map.get(vertex)
+        try:
+            return self._parent_map[vertex]
+        except KeyError:
+            # Only the root is in the tree without a parent entry
+            self._require_vertex(vertex)
+            return None
 
     def children(self, vertex: V) -> set[V]:
         """Get the children of a vertex.
 
+        The returned set is the tree's own storage rather than a copy, so it
+        reflects later modifications. Treat it as read-only, and copy it before
+        adding or removing vertices while iterating over it.
+
         Args:
             vertex: The vertex to get children of
 
         Returns:
-            A set of child vertices
+            A read-only set of child vertices
 
         Raises:
             VertexNotFoundError: If vertex doesn't exist in tree
@@ -232,7 +449,11 @@ class Tree[V: Hashable]:
             >>> tree.children("B")
             set()
         """
-        return self._graph.neighbors(vertex)
+        children = self._children_map.get(vertex)
+        if children is None:
+            raise VertexNotFoundError(f"Vertex {vertex} does not exist in tree")
+
+        return children
 
     def is_leaf(self, vertex: V) -> bool:
         """Check if a vertex is a leaf node (has no children).
@@ -255,10 +476,11 @@ class Tree[V: Hashable]:
             >>> tree.is_leaf("B")
             True
         """
-        if not self._graph.has_vertex(vertex):
+        children = self._children_map.get(vertex)
+        if children is None:
             raise VertexNotFoundError(f"Vertex {vertex} does not exist in tree")
 
-        return len(self.children(vertex)) == 0
+        return not children
 
     def is_root(self, vertex: V) -> bool:
         """Check if a vertex is the root node.
@@ -280,16 +502,16 @@ class Tree[V: Hashable]:
             >>> tree.is_root("B")
             False
         """
-        if not self._graph.has_vertex(vertex):
-            raise VertexNotFoundError(f"Vertex {vertex} does not exist in tree")
-
+        self._require_vertex(vertex)
         return vertex == self._root
 
     def height(self) -> int:
         """Calculate the height of the tree.
 
         The height is the maximum distance from the root to any leaf node.
-        A single-node tree has height 0.
+        A single-node tree has height 0. The height is the largest recorded
+        vertex depth; it is cached, kept current by add_child, and only
+        recomputed after remove_subtree, so repeated calls are O(1).
 
         Returns:
             The height of the tree
@@ -305,28 +527,20 @@ class Tree[V: Hashable]:
             >>> tree.height()
             2
         """
-        if self.num_vertices() == 1:
-            return 0
-
-        # Use BFS to find maximum depth
-        max_depth = 0
-        queue = [(self._root, 0)]  # (vertex, depth)
-
-        while queue:
-            vertex, depth = queue.pop(0)
-            max_depth = max(max_depth, depth)
-
-            # Add all children with incremented depth
-            for child in self.children(vertex):
-                queue.append((child, depth + 1))
+        if self._height_cache is not None:
+            return self._height_cache
 
+        # Every vertex already has its depth recorded, so no traversal is needed
+        max_depth = max(self._depth_map.values(), default=0)
+        self._height_cache = max_depth
         return max_depth
 
     def depth(self, vertex: V) -> int:
         """Calculate the depth of a vertex.
 
         The depth is the distance from the root to the vertex.
-        The root has depth 0.
+        The root has depth 0. Depths are recorded as vertices are added,
+        so this is an O(1) lookup.
 
         Args:
             vertex: The vertex to calculate depth for
@@ -348,25 +562,10 @@ class Tree[V: Hashable]:
             >>> tree.depth("C")
             2
         """
-        if not self._graph.has_vertex(vertex):
+        depth = self._depth_map.get(vertex)
+        if depth is None:
             raise VertexNotFoundError(f"Vertex {vertex} does not exist in tree")
 
-        # Root has depth 0
-        if vertex == self._root:
-            return 0
-
-        # Traverse from root to vertex, counting edges
-        depth = 0
-        current = vertex
-
-        while current != self._root:
-            parent = self.parent(current)
-            if parent is None:
-                # This shouldn't happen in a valid tree
-                raise ValueError(f"Vertex {vertex} is not connected to root")
-            depth += 1
-            current = parent
-
         return depth
 
     def to_graph(self) -> Graph[V]:
@@ -376,6 +575,10 @@ class Tree[V: Hashable]:
         This enables tree structures to be used with graph algorithms
         through the GraphLike protocol.
 
+        No copy is made, so the call is O(1) and the graph reflects later
+        modifications of the tree. Treat it as read-only: changing it directly
+        bypasses the tree's own parent and children indexes.
+
         Returns:
             A Graph instance representing the tree structure
 
@@ -392,21 +595,25 @@ class Tree[V: Hashable]:
         """
         return self._graph
 
-    def vertices(self) -> set[V]:
+    def vertices(self) -> KeysView[V]:
         """Get all vertices in the tree.
 
         Implements GraphLike protocol method.
 
+        Returns a live view of the tree's vertices, so membership tests are O(1)
+        and no set is built per call. The view reflects later modifications;
+        copy it with set() before modifying the tree while iterating over it.
+
         Returns:
-            A set of all vertices in the tree
+            A set-like view of all vertices in the tree
 
         Example:
             >>> tree = Tree("A")
             >>> tree.add_child("A", "B")
-            >>> tree.vertices()
-            {'A', 'B'}
+            >>> sorted(tree.vertices())
+            ['A', 'B']
         """
-        return self._graph.vertices()
+        return self._children_map.keys()
 
     def edges(self) -> set[tuple[V, V]]:
         """Get all edges in the tree.
@@ -414,8 +621,11 @@ class Tree[V: Hashable]:
         Implements GraphLike protocol method.
         Returns edges as (source, target) tuples.
 
+        The set is maintained incrementally and returned without copying, so
+        treat it as read-only, like the set returned by children().
+
         Returns:
-            A set of (source, target) tuples representing edges
+            A read-only set of (source, target) tuples representing edges
 
         Example:
             >>> tree = Tree("A")
@@ -423,20 +633,20 @@ class Tree[V: Hashable]:
             >>> tree.edges()
             {('A', 'B')}
         """
-        # Convert Edge objects to (source, target) tuples
-        return {(edge.source, edge.target) for edge in self._graph.edges()}
+        return self._edges
 
     def neighbors(self, vertex: V) -> set[V]:
         """Get neighbors (children) of a vertex.
 
         Implements GraphLike protocol method.
-        For trees, neighbors are the children of the vertex.
+        For trees, neighbors are the children of the vertex. Like children(),
+        this returns the internal set, which must not be modified.
 
         Args:
             vertex: The vertex to get neighbors of
 
         Returns:
-            A set of neighbor vertices (children)
+            A read-only set of neighbor vertices (children)
 
         Raises:
             VertexNotFoundError: If vertex doesn't exist in tree
@@ -447,7 +657,7 @@ class Tree[V: Hashable]:
             >>> tree.neighbors("A")
             {'B'}
         """
-        return self._graph.neighbors(vertex)
+        return self.children(vertex)
 
     def has_edge(self, source: V, target: V) -> bool:
         """Check if an edge exists between two vertices.
@@ -469,7 +679,7 @@ class Tree[V: Hashable]:
             >>> tree.has_edge("B", "A")
             False
         """
-        return self._graph.has_edge(source, target)
+        return (source, target) in self._edges
 
     def num_vertices(self) -> int:
         """Get the number of vertices in the tree.
@@ -485,7 +695,7 @@ class Tree[V: Hashable]:
             >>> tree.num_vertices()
             2
         """
-        return self._graph.num_vertices()
+        return self._num_vertices
 
     def num_edges(self) -> int:
         """Get the number of edges in the tree.
@@ -506,7 +716,7 @@ class Tree[V: Hashable]:
             >>> tree.num_edges()
             2
         """
-        return self._graph.num_edges()
+        return self._num_edges
 
     @staticmethod
     def _validate_graph_is_directed(graph: Graph[V]) -> None:
@@ -522,74 +732,30 @@ class Tree[V: Hashable]:
             raise ValueError("Graph must be directed to convert to tree")
 
     @staticmethod
-    def _validate_graph_is_connected_from_root(graph: Graph[V], root: V) -> None:
-        """Validate that all vertices are reachable from root.
-
-        Args:
-            graph: The graph to validate
-            root: The root vertex
+    def _revisit_error(parent_map: dict[V, V], current: V, neighbor: V) -> ValueError | InvalidGraphError:
+        """Build the error for an edge from current to an already visited neighbor.
 
-        Raises:
-            ValueError: If graph is not connected from root
-        """
-        # Use BFS to check if all vertices are reachable from root
-        visited = set()
-        queue = deque([root])
-        visited.add(root)
-
-        while queue:
-            current = queue.popleft()
-            for neighbor in graph.neighbors(current):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-
-        # Check if all vertices were visited
-        if visited != graph.vertices():
-            unreachable = graph.vertices() - visited
-            raise ValueError(f"Graph is not connected. Vertices {unreachable} are not reachable from root {root}")
-
-    @staticmethod
-    def _validate_tree_property(graph: Graph[V]) -> None:
-        """Validate that graph has tree property (n vertices, n-1 edges).
-
-        Args:
-            graph: The graph to validate
-
-        Raises:
-            InvalidGraphError: If graph doesn't have tree property
-        """
-        if graph.num_edges() != graph.num_vertices() - 1:
-            raise InvalidGraphError(
-                f"Graph does not have tree property. "
-                f"Expected {graph.num_vertices() - 1} edges for {graph.num_vertices()} vertices, "
-                f"but found {graph.num_edges()} edges"
-            )
-
-    @staticmethod
-    def _build_parent_map(graph: Graph[V], root: V) -> dict[V, V]:
-        """Build parent map using BFS traversal from root.
+        Only called on the failure path of from_graph(), so walking the parent
+        chain here costs nothing for valid trees.
 
         Args:
-            graph: The graph to traverse
-            root: The root vertex
+            parent_map: Parent pointers recorded so far by the traversal
+            current: The vertex whose out-edge was being followed
+            neighbor: The already visited target of that edge
 
         Returns:
-            Dictionary mapping each vertex (except root) to its parent
+            ValueError if neighbor is current or one of its ancestors (a cycle),
+            otherwise InvalidGraphError since neighbor would get a second parent
         """
-        parent_map: dict[V, V] = {}
-        queue_bfs = deque([root])
-        visited_bfs = {root}
-
-        while queue_bfs:
-            current = queue_bfs.popleft()
-            for neighbor in graph.neighbors(current):
-                if neighbor not in visited_bfs:
-                    visited_bfs.add(neighbor)
-                    parent_map[neighbor] = current
-                    queue_bfs.append(neighbor)
-
-        return parent_map
+        ancestor: V | None = current
+        while ancestor is not None:
+            if ancestor == neighbor:
+                return ValueError("Graph contains cycles and cannot be converted to a tree")
+            ancestor = parent_map.get(ancestor)
+        return InvalidGraphError(
+            f"Graph does not have tree property. "
+            f"Vertex {neighbor} is reachable from both {parent_map[neighbor]} and {current}"
+        )
 
     @staticmethod
     def from_graph(graph: Graph[V], root: V) -> Tree[V]:
@@ -608,7 +774,13 @@ class Tree[V: Hashable]:
             A Tree instance representing the graph structure
 
         Raises:
-            ValueError: If graph is not directed, contains cycles, or is not connected
+            ValueError: If graph is not directed or is not connected, or if it has
+                exactly n-1 edges for n vertices and contains a cycle
+            InvalidGraphError: If graph has more than n-1 edges for n vertices
+                (including cyclic graphs, which are rejected by this count check
+                before any traversal), or a vertex is reachable along more than
+                one edge
+            VertexNotFoundError: If root is not a vertex of graph
 
         Example:
             >>> graph = Graph(directed=True)
@@ -619,23 +791,67 @@ class Tree[V: Hashable]:
             >>> tree.root
             'A'
         """
-        # Validate graph meets tree constraints
         Tree._validate_graph_is_directed(graph)
-        Tree._validate_graph_is_connected_from_root(graph, root)
-
-        # Check for cycles using Graph's has_cycle method
-        if graph.has_cycle():
-            raise ValueError("Graph contains cycles and cannot be converted to a tree")
+        if not graph.has_vertex(root):
+            raise VertexNotFoundError(f"Root vertex {root} does not exist in graph")
+
+        # A tree on n vertices has exactly n-1 edges; reject other counts before traversing
+        num_vertices = graph.num_vertices()
+        num_edges = graph.num_edges()
+        if num_edges < num_vertices - 1:
+            raise ValueError(
+                f"Graph is not connected. {num_vertices} vertices need at least "
+                f"{num_vertices - 1} edges, but found {num_edges} edges"
+            )
+        if num_edges > num_vertices - 1:
+            raise InvalidGraphError(
+                f"Graph does not have tree property. "
+                f"Expected {num_vertices - 1} edges for {num_vertices} vertices, "
+                f"but found {num_edges} edges: too many edges for a tree "
+                f"(a vertex has multiple parents or there is a cycle)"
+            )
 
-        Tree._validate_tree_property(graph)
+        # One BFS from the root records the tree structure and validates it: reaching
+        # a vertex twice means a cycle or a second parent (and, with n-1 edges, that
+        # some other vertex is unreachable)
+        parent_map: dict[V, V] = {}
+        children_map: dict[V, set[V]] = {}
+        depth_map = {root: 0}
+        tree_edges: set[tuple[V, V]] = set()
+        queue = [root]
+        height = 0
+
+        # The queue is a list read front to back while it grows, so nothing is ever popped
+        for current in queue:
+            children: set[V] = set()
+            children_map[current] = children
+            # BFS visits vertices in nondecreasing depth, so the last one sets the height
+            height = depth_map[current]
+            depth = height + 1
+            for neighbor in graph.neighbors(current):
+                # depth_map holds every reached vertex, so it doubles as the visited set
+                if neighbor in depth_map:
+                    raise Tree._revisit_error(parent_map, current, neighbor)
+                parent_map[neighbor] = current
+                children.add(neighbor)
+                depth_map[neighbor] = depth
+                tree_edges.add((current, neighbor))
+                queue.append(neighbor)
+
+        if len(depth_map) != num_vertices:
+            unreachable = graph.vertices() - depth_map.keys()
+            raise ValueError(f"Graph is not connected. Vertices {unreachable} are not reachable from root {root}")
 
-        # All validations passed - create tree
         tree = Tree[V](root)
         tree._graph = graph  # pylint: disable=protected-access
         tree._root = root  # pylint: disable=protected-access
-
-        # Build parent map using BFS traversal from root
-        tree._parent_map = Tree._build_parent_map(graph, root)  # pylint: disable=protected-access
+        tree._parent_map = parent_map  # pylint: disable=protected-access
+        tree._children_map = children_map  # pylint: disable=protected-access
+        tree._depth_map = depth_map  # pylint: disable=protected-access
+        tree._edges = tree_edges  # pylint: disable=protected-access
+        tree._num_vertices = num_vertices  # pylint: disable=protected-access
+        tree._num_edges = num_edges  # pylint: disable=protected-access
+        tree._height_cache = height  # pylint: disable=protected-access
 
         return tree
 
@@ -0,0 +1,19 @@
+"""Shared pytest configuration.
+
+Registers Hypothesis settings profiles. All of them disable the per-example
+deadline, which otherwise times every example. Select a profile with the
+``HYP_PROFILE`` environment variable:
+
+- ``dev`` (default): 100 examples per property test
+- ``fast``: 30 examples, for quick local iteration on property tests
+- ``ci``: 200 examples, for more thorough runs in CI
+"""
+
+import os
+
+from hypothesis import settings
+
+settings.register_profile("dev", max_examples=100, deadline=None)
+settings.register_profile("fast", max_examples=30, deadline=None)
+settings.register_profile("ci", max_examples=200, deadline=None)
+settings.load_profile(os.environ.get("HYP_PROFILE", "dev"))
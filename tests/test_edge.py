@@ -278,5 +278,25 @@ def test_edge_undirected_self_loop():
     assert len(edge_set) == 1
 
 
+@pytest.mark.unit
+def test_edge_uses_slots():
+    """Test Edge stores its fields in slots rather than a per-instance __dict__.
+
+    The edge stays frozen, but its metadata dictionary remains mutable.
+    """
+    from dataclasses import FrozenInstanceError
+
+    from src.pygraph.edge import Edge
+
+    edge = Edge("A", "B", weight=2.0, metadata={"color": "red"})
+
+    assert not hasattr(edge, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        edge.weight = 3.0  # type: ignore[misc]
+
+    edge.metadata["color"] = "blue"
+    assert edge.metadata == {"color": "blue"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -10,12 +10,17 @@ These tests follow the TDD methodology:
 - REFACTOR phase: Improve implementation while keeping tests green
 """
 
+import re
+
 import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from pygraph.graph import Graph
 
+# Compiled once rather than on every Hypothesis example that checks the message
+_HASHABLE_RE = re.compile(".*hashable.*")
+
 
 @pytest.mark.property
 @settings(max_examples=100)
@@ -72,7 +77,7 @@ def test_property_hashable_vertex_requirement(non_hashable):
     graph = Graph()
 
     # Property: Adding non-hashable vertex should raise TypeError
-    with pytest.raises(TypeError, match=".*hashable.*"):
+    with pytest.raises(TypeError, match=_HASHABLE_RE):
         graph.add_vertex(non_hashable)
 
 
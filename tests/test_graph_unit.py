@@ -12,11 +12,56 @@ These tests follow the TDD methodology:
 
 # pylint: disable=too-many-lines
 
+import copy
+
 import pytest
 
 from pygraph.exceptions import EdgeNotFoundError, VertexNotFoundError
 from pygraph.graph import Graph
 
+# Shared read-only graphs. These are built once per session (once per worker
+# under pytest-xdist); tests must not mutate them and should take a
+# copy.deepcopy() of the fixture when they need to modify the graph.
+# Teardown compares each graph with a snapshot and fails if it was mutated.
+
+
+def _snapshot(graph):
+    """Vertices and (source, target, weight) edges of graph, for mutation checks."""
+    return graph.vertices(), {(edge.source, edge.target, edge.weight) for edge in graph.edges()}
+
+
+@pytest.fixture(scope="session")
+def undirected_triangle():
+    """Undirected triangle A-B, A-C, B-C plus isolated vertex D."""
+    graph = Graph[str](directed=False)
+    graph.add_vertices(["A", "B", "C", "D"])
+    graph.add_edges([("A", "B", 1.0), ("A", "C", 1.0), ("B", "C", 1.0)])
+    snapshot = _snapshot(graph)
+    yield graph
+    assert _snapshot(graph) == snapshot, "undirected_triangle fixture was mutated by a test"
+
+
+@pytest.fixture(scope="session")
+def directed_path():
+    """Directed path A->B->C."""
+    graph = Graph[str](directed=True)
+    graph.add_vertices(["A", "B", "C"])
+    graph.add_edges([("A", "B"), ("B", "C")])
+    snapshot = _snapshot(graph)
+    yield graph
+    assert _snapshot(graph) == snapshot, "directed_path fixture was mutated by a test"
+
+
+@pytest.fixture(scope="session")
+def undirected_path():
+    """Undirected path A-B-C."""
+    graph = Graph[str](directed=False)
+    graph.add_vertices(["A", "B", "C"])
+    graph.add_edges([("A", "B"), ("B", "C")])
+    snapshot = _snapshot(graph)
+    yield graph
+    assert _snapshot(graph) == snapshot, "undirected_path fixture was mutated by a test"
+
 
 @pytest.mark.unit
 @pytest.mark.parametrize(
@@ -146,6 +191,30 @@ def test_graph_add_vertex_idempotent():
     assert len(vertices) == 1
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("representation", ["adjacency_list", "adjacency_matrix"])
+def test_graph_add_vertices_batch(representation):
+    """Test adding several vertices at once, including existing ones."""
+    graph = Graph(representation=representation)
+    graph.add_vertex("A")
+
+    graph.add_vertices(["A", "B", "C", 42])
+
+    assert graph.vertices() == {"A", "B", "C", 42}
+    assert graph.num_vertices() == 4
+
+
+@pytest.mark.unit
+def test_graph_add_vertices_non_hashable_is_atomic():
+    """Test that a non-hashable vertex in a batch rejects the whole batch."""
+    graph = Graph()
+
+    with pytest.raises(TypeError, match="Vertex must be hashable"):
+        graph.add_vertices(["A", [1, 2], "B"])
+
+    assert graph.num_vertices() == 0
+
+
 @pytest.mark.unit
 def test_graph_add_vertex_non_hashable():
     """Test that adding non-hashable vertex raises TypeError."""
@@ -329,6 +398,32 @@ def test_graph_add_edge_success():
     assert graph.has_edge("B", "C")
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("representation", ["adjacency_list", "adjacency_matrix"])
+def test_graph_add_edges_batch(representation):
+    """Test adding several edges at once with optional weights."""
+    graph = Graph(directed=True, representation=representation)
+    graph.add_vertices(["A", "B", "C"])
+
+    graph.add_edges([("A", "B"), ("B", "C", 2.5), ("A", "B")])
+
+    assert graph.num_edges() == 2
+    assert graph.get_edge("A", "B").weight == 1.0
+    assert graph.get_edge("B", "C").weight == 2.5
+
+
+@pytest.mark.unit
+def test_graph_add_edges_with_nonexistent_vertex_is_atomic():
+    """Test that a missing endpoint in a batch rejects the whole batch."""
+    graph = Graph()
+    graph.add_vertices(["A", "B"])
+
+    with pytest.raises(VertexNotFoundError, match="Vertex 'nonexistent' not found"):
+        graph.add_edges([("A", "B"), ("A", "nonexistent")])
+
+    assert graph.num_edges() == 0
+
+
 @pytest.mark.unit
 def test_graph_add_edge_with_nonexistent_vertex():
     """Test that adding edge with non-existent vertex raises VertexNotFoundError."""
@@ -581,20 +676,9 @@ def test_graph_edge_operations_atomic():
 
 
 @pytest.mark.unit
-def test_graph_neighbors_returns_correct_set():
+def test_graph_neighbors_returns_correct_set(undirected_triangle):
     """Test that neighbors() returns correct set of adjacent vertices."""
-    graph = Graph(directed=False)
-
-    # Add vertices
-    graph.add_vertex("A")
-    graph.add_vertex("B")
-    graph.add_vertex("C")
-    graph.add_vertex("D")
-
-    # Add edges: A-B, A-C, B-C
-    graph.add_edge("A", "B", weight=1.0)
-    graph.add_edge("A", "C", weight=1.0)
-    graph.add_edge("B", "C", weight=1.0)
+    graph = undirected_triangle
 
     # Check neighbors
     neighbors_a = graph.neighbors("A")
@@ -647,20 +731,9 @@ def test_graph_neighbors_nonexistent_vertex():
 
 
 @pytest.mark.unit
-def test_graph_degree_undirected():
+def test_graph_degree_undirected(undirected_triangle):
     """Test that degree() works correctly for undirected graphs."""
-    graph = Graph(directed=False)
-
-    # Add vertices
-    graph.add_vertex("A")
-    graph.add_vertex("B")
-    graph.add_vertex("C")
-    graph.add_vertex("D")
-
-    # Add edges: A-B, A-C, B-C
-    graph.add_edge("A", "B", weight=1.0)
-    graph.add_edge("A", "C", weight=1.0)
-    graph.add_edge("B", "C", weight=1.0)
+    graph = undirected_triangle
 
     # Check degrees
     assert graph.degree("A") == 2, "A should have degree 2"
@@ -994,6 +1067,28 @@ def test_graph_convert_updates_representation_attribute():
     assert graph.representation == "adjacency_list"
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("representation", ["adjacency_list", "adjacency_matrix"])
+def test_graph_reorder_rcm_preserves_graph(representation):
+    """Test that Graph.reorder_rcm() keeps vertices, edges and edge data intact."""
+    graph = Graph[int](directed=True, representation=representation)
+    graph.add_vertices([0, 1, 2, 3, 4])
+    graph.add_edges([(0, 3, 2.5), (3, 1), (1, 4), (4, 2)])
+    graph.add_edge(2, 0, metadata={"label": "back"})
+    initial_vertices = graph.vertices()
+    initial_edges = graph.edges()
+
+    graph.reorder_rcm()
+
+    assert graph.representation == representation
+    assert graph.vertices() == initial_vertices
+    assert graph.edges() == initial_edges
+    assert graph.get_edge(0, 3).weight == 2.5
+    assert graph.get_edge(2, 0).metadata == {"label": "back"}
+    assert graph.neighbors(3) == {1}
+    assert graph.has_cycle()
+
+
 @pytest.mark.unit
 def test_graph_convert_empty_graph():
     """Test converting representation of an empty graph."""
@@ -1194,17 +1289,12 @@ def test_graph_is_connected_single_vertex():
 
 
 @pytest.mark.unit
-def test_graph_is_connected_undirected():
+def test_graph_is_connected_undirected(undirected_path):
     """Test is_connected for undirected graphs."""
-    graph = Graph[str](directed=False)
-
     # Connected graph
-    graph.add_vertex("A")
-    graph.add_vertex("B")
-    graph.add_vertex("C")
-    graph.add_edge("A", "B")
-    graph.add_edge("B", "C")
-    assert graph.is_connected()
+    assert undirected_path.is_connected()
+
+    graph = copy.deepcopy(undirected_path)
 
     # Disconnected graph
     graph.add_vertex("D")  # Isolated vertex
@@ -1242,51 +1332,29 @@ def test_graph_has_cycle_empty_graph():
 
 
 @pytest.mark.unit
-def test_graph_has_cycle_directed_acyclic():
+def test_graph_has_cycle_directed_acyclic(directed_path):
     """Test has_cycle for directed acyclic graph (DAG)."""
-    graph = Graph[str](directed=True)
-    graph.add_vertex("A")
-    graph.add_vertex("B")
-    graph.add_vertex("C")
-    graph.add_edge("A", "B")
-    graph.add_edge("B", "C")
-    assert not graph.has_cycle()
+    assert not directed_path.has_cycle()
 
 
 @pytest.mark.unit
-def test_graph_has_cycle_directed_cyclic():
+def test_graph_has_cycle_directed_cyclic(directed_path):
     """Test has_cycle for directed cyclic graph."""
-    graph = Graph[str](directed=True)
-    graph.add_vertex("A")
-    graph.add_vertex("B")
-    graph.add_vertex("C")
-    graph.add_edge("A", "B")
-    graph.add_edge("B", "C")
+    graph = copy.deepcopy(directed_path)
     graph.add_edge("C", "A")  # Creates cycle
     assert graph.has_cycle()
 
 
 @pytest.mark.unit
-def test_graph_has_cycle_undirected_acyclic():
+def test_graph_has_cycle_undirected_acyclic(undirected_path):
     """Test has_cycle for undirected acyclic graph (tree)."""
-    graph = Graph[str](directed=False)
-    graph.add_vertex("A")
-    graph.add_vertex("B")
-    graph.add_vertex("C")
-    graph.add_edge("A", "B")
-    graph.add_edge("B", "C")
-    assert not graph.has_cycle()
+    assert not undirected_path.has_cycle()
 
 
 @pytest.mark.unit
-def test_graph_has_cycle_undirected_cyclic():
+def test_graph_has_cycle_undirected_cyclic(undirected_path):
     """Test has_cycle for undirected cyclic graph."""
-    graph = Graph[str](directed=False)
-    graph.add_vertex("A")
-    graph.add_vertex("B")
-    graph.add_vertex("C")
-    graph.add_edge("A", "B")
-    graph.add_edge("B", "C")
+    graph = copy.deepcopy(undirected_path)
     graph.add_edge("C", "A")  # Creates cycle
     assert graph.has_cycle()
 
@@ -1,5 +1,7 @@
 """Test to verify Hypothesis configuration is working correctly."""
 
+import os
+
 import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
@@ -42,12 +44,23 @@ def test_hypothesis_custom_iterations(x):
 
 @pytest.mark.unit
 def test_hypothesis_settings_applied():
-    """Verify that Hypothesis settings from pyproject.toml are applied."""
+    """Verify that the Hypothesis profile selected in conftest.py is applied.
+
+    Each profile's documented example floor is hard-coded here, so a profile
+    registered with too few examples fails instead of being compared with
+    itself. The active profile comes from ``HYP_PROFILE`` (default ``dev``).
+    """
     # pylint: disable=import-outside-toplevel,reimported
     from hypothesis import settings as hypothesis_settings
 
-    # Get the default profile settings
+    floors = {"dev": 100, "fast": 30, "ci": 200}
+    profile = os.environ.get("HYP_PROFILE", "dev")
+    assert profile in floors, f"Unknown Hypothesis profile {profile!r}"
+
+    # Get the active settings
     default_settings = hypothesis_settings.default
+    assert default_settings is not None, "No Hypothesis profile is loaded"
 
-    # Verify max_examples is at least 100
-    assert default_settings.max_examples >= 100, f"Expected max_examples >= 100, got {default_settings.max_examples}"
+    assert default_settings.max_examples >= floors[profile], (
+        f"Expected max_examples >= {floors[profile]} for profile {profile!r}, got {default_settings.max_examples}"
+    )
@@ -3,381 +3,149 @@
 This module tests the AdjacencyList and AdjacencyMatrix classes that implement
 the GraphRepresentation protocol. These tests verify the public behavior
 and interface compliance, not internal implementation details.
+
+Both representations share the same public contract, so every test runs
+once per representation class via the parametrized ``repr_cls`` fixture.
+Tests obtain fresh instances from the ``new_repr`` factory fixture.
 """
 
 import pytest
 
-from pygraph.representations import AdjacencyList, AdjacencyMatrix
+from pygraph.representations import AdjacencyList, AdjacencyMatrix, _reverse_cuthill_mckee
 
 
-class TestAdjacencyList:
-    """Test cases for AdjacencyList representation."""
+@pytest.fixture(params=[AdjacencyList, AdjacencyMatrix], ids=["adjacency_list", "adjacency_matrix"])
+def repr_cls(request):
+    """Provide each representation class in turn."""
+    return request.param
 
-    @pytest.mark.unit
-    def test_initialization_directed(self):
-        """Test AdjacencyList initialization for directed graphs."""
-        adj_list = AdjacencyList[str](directed=True)
 
-        # Test public behavior: empty graph should have no vertices or edges
-        assert adj_list.get_vertices() == set()
-        assert not adj_list.get_edges()
+@pytest.fixture
+def new_repr(repr_cls):
+    """Return a factory producing fresh, empty instances of the current representation."""
 
-    @pytest.mark.unit
-    def test_initialization_undirected(self):
-        """Test AdjacencyList initialization for undirected graphs."""
-        adj_list = AdjacencyList[str](directed=False)
+    def factory(directed: bool = False):
+        return repr_cls[str](directed=directed)
 
-        # Test public behavior: empty graph should have no vertices or edges
-        assert adj_list.get_vertices() == set()
-        assert not adj_list.get_edges()
+    return factory
 
-    @pytest.mark.unit
-    def test_add_vertex_new(self):
-        """Test adding a new vertex."""
-        adj_list = AdjacencyList[str]()
-        result = adj_list.add_vertex("A")
 
-        assert result is True
-        assert adj_list.has_vertex("A")
-        assert "A" in adj_list.get_vertices()
+class TestRepresentation:
+    """Test cases shared by all GraphRepresentation implementations."""
 
     @pytest.mark.unit
-    def test_add_vertex_existing(self):
-        """Test adding an existing vertex (idempotent)."""
-        adj_list = AdjacencyList[str]()
-        adj_list.add_vertex("A")
-        result = adj_list.add_vertex("A")
-
-        assert result is False
-        assert adj_list.has_vertex("A")
-        assert len(adj_list.get_vertices()) == 1
-
-    @pytest.mark.unit
-    def test_remove_vertex_existing(self):
-        """Test removing an existing vertex."""
-        adj_list = AdjacencyList[str]()
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
-        adj_list.add_edge("A", "B")
-
-        result = adj_list.remove_vertex("A")
-        assert result is True
-        assert not adj_list.has_vertex("A")
-        assert not adj_list.has_edge("A", "B")  # Edge should be removed
-        assert not adj_list.has_edge("B", "A")  # Reverse edge should be removed
-
-    @pytest.mark.unit
-    def test_remove_vertex_nonexistent(self):
-        """Test removing a non-existent vertex."""
-        adj_list = AdjacencyList[str]()
-        result = adj_list.remove_vertex("A")
-        assert result is False
-
-    @pytest.mark.unit
-    def test_add_edge_directed(self):
-        """Test adding edge in directed graph."""
-        adj_list = AdjacencyList[str](directed=True)
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
-
-        result = adj_list.add_edge("A", "B", weight=2.5, metadata={"type": "road"})
-        assert result is True
-
-        # Check edge exists in forward direction
-        assert adj_list.has_edge("A", "B")
-        edge = adj_list.get_edge_data("A", "B")
-        assert edge is not None
-        assert edge.source == "A"
-        assert edge.target == "B"
-        assert edge.weight == 2.5
-        assert edge.metadata == {"type": "road"}
-
-        # Check reverse edge doesn't exist (directed)
-        assert not adj_list.has_edge("B", "A")
-
-    @pytest.mark.unit
-    def test_add_edge_undirected(self):
-        """Test adding edge in undirected graph."""
-        adj_list = AdjacencyList[str](directed=False)
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
-
-        result = adj_list.add_edge("A", "B", weight=3.0)
-        assert result is True
-
-        # Check both directions exist (undirected)
-        assert adj_list.has_edge("A", "B")
-        assert adj_list.has_edge("B", "A")
+    @pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
+    def test_initialization(self, new_repr, directed):
+        """Test representation initialization for directed and undirected graphs."""
+        rep = new_repr(directed=directed)
 
-        # Check edge data
-        forward_edge = adj_list.get_edge_data("A", "B")
-        reverse_edge = adj_list.get_edge_data("B", "A")
-        assert forward_edge is not None
-        assert reverse_edge is not None
-
-        # Both edges are normalized to canonical form (A < B)
-        assert forward_edge.source == "A" and forward_edge.target == "B"
-        assert reverse_edge.source == "A" and reverse_edge.target == "B"
-        assert forward_edge.weight == reverse_edge.weight == 3.0
-
-        # The edges are equal due to normalization
-        assert forward_edge == reverse_edge
-
-    @pytest.mark.unit
-    def test_add_edge_nonexistent_vertices(self):
-        """Test adding edge with non-existent vertices."""
-        adj_list = AdjacencyList[str]()
-        result = adj_list.add_edge("A", "B")
-        assert result is False
-
-        # Add one vertex and try again
-        adj_list.add_vertex("A")
-        result = adj_list.add_edge("A", "B")
-        assert result is False
-
-    @pytest.mark.unit
-    def test_add_edge_existing(self):
-        """Test adding an existing edge (idempotent)."""
-        adj_list = AdjacencyList[str]()
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
-        adj_list.add_edge("A", "B")
-
-        result = adj_list.add_edge("A", "B")
-        assert result is False
-
-    @pytest.mark.unit
-    def test_remove_edge_directed(self):
-        """Test removing edge in directed graph."""
-        adj_list = AdjacencyList[str](directed=True)
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
-        adj_list.add_edge("A", "B")
-
-        result = adj_list.remove_edge("A", "B")
-        assert result is True
-        assert not adj_list.has_edge("A", "B")
+        # Test public behavior: empty graph should have no vertices or edges
+        assert rep.get_vertices() == set()
+        assert not rep.get_edges()
 
     @pytest.mark.unit
-    def test_remove_edge_undirected(self):
-        """Test removing edge in undirected graph."""
-        adj_list = AdjacencyList[str](directed=False)
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
-        adj_list.add_edge("A", "B")
+    def test_add_vertex_new(self, new_repr):
+        """Test adding a new vertex."""
+        rep = new_repr()
+        result = rep.add_vertex("A")
 
-        result = adj_list.remove_edge("A", "B")
         assert result is True
-        assert not adj_list.has_edge("A", "B")
-        assert not adj_list.has_edge("B", "A")
+        assert rep.has_vertex("A")
+        assert "A" in rep.get_vertices()
 
     @pytest.mark.unit
-    def test_remove_edge_nonexistent(self):
-        """Test removing non-existent edge."""
-        adj_list = AdjacencyList[str]()
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
+    def test_add_vertex_existing(self, new_repr):
+        """Test adding an existing vertex (idempotent)."""
+        rep = new_repr()
+        rep.add_vertex("A")
+        result = rep.add_vertex("A")
 
-        result = adj_list.remove_edge("A", "B")
         assert result is False
+        assert rep.has_vertex("A")
+        assert len(rep.get_vertices()) == 1
 
     @pytest.mark.unit
-    def test_remove_edge_nonexistent_vertices(self):
-        """Test removing edge when vertices don't exist in graph."""
-        adj_list = AdjacencyList[str]()
-
-        # Try to remove edge when no vertices exist
-        result1 = adj_list.remove_edge("A", "B")
-        assert result1 is False
-
-        # Add one vertex, try to remove edge to non-existent vertex
-        adj_list.add_vertex("A")
-        result2 = adj_list.remove_edge("A", "B")  # B doesn't exist
-        assert result2 is False
+    def test_add_multiple_vertices(self, new_repr):
+        """Test adding multiple vertices in one batch."""
+        rep = new_repr()
+        result = rep.add_vertices(["A", "B", "C"])
 
-        result3 = adj_list.remove_edge("B", "A")  # B doesn't exist
-        assert result3 is False
-
-    @pytest.mark.unit
-    def test_has_vertex(self):
-        """Test vertex existence check."""
-        adj_list = AdjacencyList[str]()
-        assert adj_list.has_vertex("A") is False
-
-        adj_list.add_vertex("A")
-        assert adj_list.has_vertex("A") is True
-
-    @pytest.mark.unit
-    def test_has_edge(self):
-        """Test edge existence check."""
-        adj_list = AdjacencyList[str]()
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
-
-        assert adj_list.has_edge("A", "B") is False
-
-        adj_list.add_edge("A", "B")
-        assert adj_list.has_edge("A", "B") is True
-
-    @pytest.mark.unit
-    def test_get_vertices(self):
-        """Test getting all vertices."""
-        adj_list = AdjacencyList[str]()
-        assert adj_list.get_vertices() == set()
-
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
-        assert adj_list.get_vertices() == {"A", "B"}
-
-    @pytest.mark.unit
-    def test_get_edges(self):
-        """Test getting all edges."""
-        adj_list = AdjacencyList[str](directed=True)
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
-
-        assert not adj_list.get_edges()
-
-        adj_list.add_edge("A", "B", weight=2.0)
-        edges = adj_list.get_edges()
-        assert len(edges) == 1
-        edge = next(iter(edges))  # Get the single edge from the set
-        assert edge.source == "A"
-        assert edge.target == "B"
-        assert edge.weight == 2.0
+        assert result == 3
+        vertices = rep.get_vertices()
+        assert vertices == {"A", "B", "C"}
+        assert len(vertices) == 3
 
     @pytest.mark.unit
-    def test_get_neighbors(self):
-        """Test getting neighbors of a vertex."""
-        adj_list = AdjacencyList[str]()
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
-        adj_list.add_vertex("C")
+    def test_add_vertices_skips_existing_and_duplicates(self, new_repr):
+        """Test batch vertex addition ignores existing and repeated vertices."""
+        rep = new_repr()
+        rep.add_vertex("A")
+        rep.add_edge("A", "A")
 
-        # No neighbors initially
-        assert adj_list.get_neighbors("A") == set()
-
-        # Add edges
-        adj_list.add_edge("A", "B")
-        adj_list.add_edge("A", "C")
-        assert adj_list.get_neighbors("A") == {"B", "C"}
+        assert rep.add_vertices(["A", "B", "B", "C"]) == 2
+        assert rep.get_vertices() == {"A", "B", "C"}
+        assert rep.add_vertices([]) == 0
 
-        # Non-existent vertex
-        assert adj_list.get_neighbors("D") == set()
+        # Existing edges survive the resize and new vertices are usable
+        assert rep.has_edge("A", "A")
+        assert rep.add_edge("B", "C")
+        assert rep.has_edge("B", "C")
 
     @pytest.mark.unit
-    def test_get_edge_data(self):
-        """Test getting edge data."""
-        adj_list = AdjacencyList[str]()
-        adj_list.add_vertex("A")
-        adj_list.add_vertex("B")
+    def test_add_edges(self, new_repr):
+        """Test adding multiple edges in one batch."""
+        rep = new_repr(directed=True)
+        rep.add_vertices(["A", "B", "C"])
 
-        # Non-existent edge
-        assert adj_list.get_edge_data("A", "B") is None
+        result = rep.add_edges([("A", "B"), ("B", "C", 2.5), ("A", "B"), ("A", "D")])
 
-        # Add edge and retrieve
-        adj_list.add_edge("A", "B", weight=1.5, metadata={"color": "red"})
-        edge = adj_list.get_edge_data("A", "B")
+        # Duplicate edge and edge to a missing vertex are not counted
+        assert result == 2
+        assert rep.has_edge("A", "B")
+        edge = rep.get_edge_data("B", "C")
         assert edge is not None
-        assert edge.source == "A"
-        assert edge.target == "B"
-        assert edge.weight == 1.5
-        assert edge.metadata == {"color": "red"}
-
-
-class TestAdjacencyMatrix:
-    """Test cases for AdjacencyMatrix representation."""
-
-    @pytest.mark.unit
-    def test_initialization_directed(self):
-        """Test AdjacencyMatrix initialization for directed graphs."""
-        adj_matrix = AdjacencyMatrix[str](directed=True)
-
-        # Test public behavior: empty graph should have no vertices or edges
-        assert adj_matrix.get_vertices() == set()
-        assert not adj_matrix.get_edges()
-
-    @pytest.mark.unit
-    def test_initialization_undirected(self):
-        """Test AdjacencyMatrix initialization for undirected graphs."""
-        adj_matrix = AdjacencyMatrix[str](directed=False)
-
-        # Test public behavior: empty graph should have no vertices or edges
-        assert adj_matrix.get_vertices() == set()
-        assert not adj_matrix.get_edges()
-
-    @pytest.mark.unit
-    def test_add_vertex_new(self):
-        """Test adding a new vertex."""
-        adj_matrix = AdjacencyMatrix[str]()
-        result = adj_matrix.add_vertex("A")
-
-        assert result is True
-        assert adj_matrix.has_vertex("A")
-        assert "A" in adj_matrix.get_vertices()
-
-    @pytest.mark.unit
-    def test_add_vertex_existing(self):
-        """Test adding an existing vertex (idempotent)."""
-        adj_matrix = AdjacencyMatrix[str]()
-        adj_matrix.add_vertex("A")
-        result = adj_matrix.add_vertex("A")
-
-        assert result is False
-        assert adj_matrix.has_vertex("A")
-        assert len(adj_matrix.get_vertices()) == 1
-
-    @pytest.mark.unit
-    def test_add_multiple_vertices(self):
-        """Test adding multiple vertices."""
-        adj_matrix = AdjacencyMatrix[str]()
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
-        adj_matrix.add_vertex("C")
-
-        vertices = adj_matrix.get_vertices()
-        assert vertices == {"A", "B", "C"}
-        assert len(vertices) == 3
+        assert edge.weight == 2.5
 
     @pytest.mark.unit
-    def test_remove_vertex_existing(self):
+    def test_remove_vertex_existing(self, new_repr):
         """Test removing an existing vertex."""
-        adj_matrix = AdjacencyMatrix[str]()
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
-        adj_matrix.add_vertex("C")
-        adj_matrix.add_edge("A", "B")
-        adj_matrix.add_edge("B", "C")
-
-        result = adj_matrix.remove_vertex("B")
+        rep = new_repr()
+        rep.add_vertex("A")
+        rep.add_vertex("B")
+        rep.add_vertex("C")
+        rep.add_edge("A", "B")
+        rep.add_edge("B", "C")
+
+        result = rep.remove_vertex("B")
         assert result is True
-        assert not adj_matrix.has_vertex("B")
-        assert adj_matrix.get_vertices() == {"A", "C"}
+        assert not rep.has_vertex("B")
+        assert rep.get_vertices() == {"A", "C"}
 
-        # Edges involving B should be removed
-        assert not adj_matrix.has_edge("A", "B")
-        assert not adj_matrix.has_edge("B", "C")
+        # Edges involving B should be removed in both directions
+        assert not rep.has_edge("A", "B")
+        assert not rep.has_edge("B", "A")
+        assert not rep.has_edge("B", "C")
 
     @pytest.mark.unit
-    def test_remove_vertex_nonexistent(self):
+    def test_remove_vertex_nonexistent(self, new_repr):
         """Test removing a non-existent vertex."""
-        adj_matrix = AdjacencyMatrix[str]()
-        result = adj_matrix.remove_vertex("A")
+        rep = new_repr()
+        result = rep.remove_vertex("A")
         assert result is False
 
     @pytest.mark.unit
-    def test_add_edge_directed(self):
+    def test_add_edge_directed(self, new_repr):
         """Test adding edge in directed graph."""
-        adj_matrix = AdjacencyMatrix[str](directed=True)
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
+        rep = new_repr(directed=True)
+        rep.add_vertex("A")
+        rep.add_vertex("B")
 
-        result = adj_matrix.add_edge("A", "B", weight=2.5, metadata={"type": "road"})
+        result = rep.add_edge("A", "B", weight=2.5, metadata={"type": "road"})
         assert result is True
 
         # Check edge exists in forward direction
-        assert adj_matrix.has_edge("A", "B")
-        edge = adj_matrix.get_edge_data("A", "B")
+        assert rep.has_edge("A", "B")
+        edge = rep.get_edge_data("A", "B")
         assert edge is not None
         assert edge.source == "A"
         assert edge.target == "B"
@@ -385,185 +153,205 @@ class TestAdjacencyMatrix:
         assert edge.metadata == {"type": "road"}
 
         # Check reverse edge doesn't exist (directed)
-        assert not adj_matrix.has_edge("B", "A")
+        assert not rep.has_edge("B", "A")
 
     @pytest.mark.unit
-    def test_add_edge_undirected(self):
+    def test_add_edge_undirected(self, new_repr):
         """Test adding edge in undirected graph."""
-        adj_matrix = AdjacencyMatrix[str](directed=False)
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
+        rep = new_repr(directed=False)
+        rep.add_vertex("A")
+        rep.add_vertex("B")
 
-        result = adj_matrix.add_edge("A", "B", weight=3.0)
+        result = rep.add_edge("A", "B", weight=3.0)
         assert result is True
 
         # Check both directions exist (undirected)
-        assert adj_matrix.has_edge("A", "B")
-        assert adj_matrix.has_edge("B", "A")
+        assert rep.has_edge("A", "B")
+        assert rep.has_edge("B", "A")
 
-        forward_edge = adj_matrix.get_edge_data("A", "B")
-        reverse_edge = adj_matrix.get_edge_data("B", "A")
+        # Check edge data
+        forward_edge = rep.get_edge_data("A", "B")
+        reverse_edge = rep.get_edge_data("B", "A")
         assert forward_edge is not None
         assert reverse_edge is not None
 
         # Both edges are normalized to canonical form (A < B)
         assert forward_edge.source == "A" and forward_edge.target == "B"
         assert reverse_edge.source == "A" and reverse_edge.target == "B"
+        assert forward_edge.weight == reverse_edge.weight == 3.0
 
         # The edges are equal due to normalization
         assert forward_edge == reverse_edge
 
     @pytest.mark.unit
-    def test_add_edge_nonexistent_vertices(self):
+    def test_add_edge_nonexistent_vertices(self, new_repr):
         """Test adding edge with non-existent vertices."""
-        adj_matrix = AdjacencyMatrix[str]()
-        result = adj_matrix.add_edge("A", "B")
+        rep = new_repr()
+        result = rep.add_edge("A", "B")
+        assert result is False
+
+        # Add one vertex and try again
+        rep.add_vertex("A")
+        result = rep.add_edge("A", "B")
         assert result is False
 
     @pytest.mark.unit
-    def test_add_edge_existing(self):
+    def test_add_edge_existing(self, new_repr):
         """Test adding an existing edge (idempotent)."""
-        adj_matrix = AdjacencyMatrix[str]()
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
-        adj_matrix.add_edge("A", "B")
+        rep = new_repr()
+        rep.add_vertex("A")
+        rep.add_vertex("B")
+        rep.add_edge("A", "B")
 
-        result = adj_matrix.add_edge("A", "B")
+        result = rep.add_edge("A", "B")
         assert result is False
 
     @pytest.mark.unit
-    def test_remove_edge_directed(self):
+    def test_remove_edge_directed(self, new_repr):
         """Test removing edge in directed graph."""
-        adj_matrix = AdjacencyMatrix[str](directed=True)
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
-        adj_matrix.add_edge("A", "B")
+        rep = new_repr(directed=True)
+        rep.add_vertex("A")
+        rep.add_vertex("B")
+        rep.add_edge("A", "B")
 
-        result = adj_matrix.remove_edge("A", "B")
+        result = rep.remove_edge("A", "B")
         assert result is True
-        assert not adj_matrix.has_edge("A", "B")
+        assert not rep.has_edge("A", "B")
 
     @pytest.mark.unit
-    def test_remove_edge_undirected(self):
+    def test_remove_edge_undirected(self, new_repr):
         """Test removing edge in undirected graph."""
-        adj_matrix = AdjacencyMatrix[str](directed=False)
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
-        adj_matrix.add_edge("A", "B")
+        rep = new_repr(directed=False)
+        rep.add_vertex("A")
+        rep.add_vertex("B")
+        rep.add_edge("A", "B")
 
-        result = adj_matrix.remove_edge("A", "B")
+        result = rep.remove_edge("A", "B")
         assert result is True
-        assert not adj_matrix.has_edge("A", "B")
-        assert not adj_matrix.has_edge("B", "A")
+        assert not rep.has_edge("A", "B")
+        assert not rep.has_edge("B", "A")
 
     @pytest.mark.unit
-    def test_remove_edge_nonexistent(self):
+    def test_remove_edge_nonexistent(self, new_repr):
         """Test removing non-existent edge."""
-        adj_matrix = AdjacencyMatrix[str]()
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
+        rep = new_repr()
+        rep.add_vertex("A")
+        rep.add_vertex("B")
 
-        result = adj_matrix.remove_edge("A", "B")
+        result = rep.remove_edge("A", "B")
         assert result is False
 
     @pytest.mark.unit
-    def test_remove_edge_twice(self):
+    def test_remove_edge_twice(self, new_repr):
         """Test removing the same edge twice."""
-        adj_matrix = AdjacencyMatrix[str]()
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
-        adj_matrix.add_edge("A", "B")
+        rep = new_repr()
+        rep.add_vertex("A")
+        rep.add_vertex("B")
+        rep.add_edge("A", "B")
 
         # Remove edge first time
-        result1 = adj_matrix.remove_edge("A", "B")
+        result1 = rep.remove_edge("A", "B")
         assert result1 is True
 
         # Try to remove same edge again
-        result2 = adj_matrix.remove_edge("A", "B")
+        result2 = rep.remove_edge("A", "B")
         assert result2 is False
 
         # Also test the reverse direction for undirected graph
-        result3 = adj_matrix.remove_edge("B", "A")
+        result3 = rep.remove_edge("B", "A")
         assert result3 is False
 
     @pytest.mark.unit
-    def test_remove_edge_never_added(self):
+    def test_remove_edge_never_added(self, new_repr):
         """Test removing edge that was never added."""
-        adj_matrix = AdjacencyMatrix[str](directed=True)
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
+        rep = new_repr(directed=True)
+        rep.add_vertex("A")
+        rep.add_vertex("B")
 
         # Verify vertices exist but no edge between them
-        assert adj_matrix.has_vertex("A")
-        assert adj_matrix.has_vertex("B")
-        assert not adj_matrix.has_edge("A", "B")
+        assert rep.has_vertex("A")
+        assert rep.has_vertex("B")
+        assert not rep.has_edge("A", "B")
 
         # Try to remove edge that was never added
-        result = adj_matrix.remove_edge("A", "B")
+        result = rep.remove_edge("A", "B")
         assert result is False
 
     @pytest.mark.unit
-    def test_remove_edge_nonexistent_vertices(self):
+    def test_remove_edge_nonexistent_vertices(self, new_repr):
         """Test removing edge when vertices don't exist in graph."""
-        adj_matrix = AdjacencyMatrix[str]()
+        rep = new_repr()
 
         # Try to remove edge when no vertices exist
-        result1 = adj_matrix.remove_edge("A", "B")
+        result1 = rep.remove_edge("A", "B")
         assert result1 is False
 
         # Add one vertex, try to remove edge to non-existent vertex
-        adj_matrix.add_vertex("A")
-        result2 = adj_matrix.remove_edge("A", "B")  # B doesn't exist
+        rep.add_vertex("A")
+        result2 = rep.remove_edge("A", "B")  # B doesn't exist
         assert result2 is False
 
-        result3 = adj_matrix.remove_edge("B", "A")  # B doesn't exist
+        result3 = rep.remove_edge("B", "A")  # B doesn't exist
         assert result3 is False
 
     @pytest.mark.unit
-    def test_has_vertex(self):
+    def test_has_vertex(self, new_repr):
         """Test vertex existence check."""
-        adj_matrix = AdjacencyMatrix[str]()
-        assert adj_matrix.has_vertex("A") is False
+        rep = new_repr()
+        assert rep.has_vertex("A") is False
 
-        adj_matrix.add_vertex("A")
-        assert adj_matrix.has_vertex("A") is True
+        rep.add_vertex("A")
+        assert rep.has_vertex("A") is True
 
     @pytest.mark.unit
-    def test_has_edge(self):
+    def test_has_edge(self, new_repr):
         """Test edge existence check."""
-        adj_matrix = AdjacencyMatrix[str]()
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
+        rep = new_repr()
+        rep.add_vertex("A")
+        rep.add_vertex("B")
 
-        assert adj_matrix.has_edge("A", "B") is False
+        assert rep.has_edge("A", "B") is False
 
-        adj_matrix.add_edge("A", "B")
-        assert adj_matrix.has_edge("A", "B") is True
+        rep.add_edge("A", "B")
+        assert rep.has_edge("A", "B") is True
 
         # Test with non-existent vertices
-        assert adj_matrix.has_edge("C", "D") is False
+        assert rep.has_edge("C", "D") is False
 
     @pytest.mark.unit
-    def test_get_vertices(self):
+    def test_get_vertices(self, new_repr):
         """Test getting all vertices."""
-        adj_matrix = AdjacencyMatrix[str]()
-        assert adj_matrix.get_vertices() == set()
+        rep = new_repr()
+        assert rep.get_vertices() == set()
+
+        rep.add_vertex("A")
+        rep.add_vertex("B")
+        assert rep.get_vertices() == {"A", "B"}
+
+    @pytest.mark.unit
+    def test_get_vertices_is_live_view(self, new_repr):
+        """Test that get_vertices returns a set-like view reflecting later changes."""
+        rep = new_repr()
+        rep.add_vertices(["A", "B"])
+        vertices = rep.get_vertices()
+
+        rep.add_vertex("C")
+        rep.remove_vertex("A")
 
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
-        assert adj_matrix.get_vertices() == {"A", "B"}
+        assert vertices == {"B", "C"}
+        assert vertices & {"B", "D"} == {"B"}
 
     @pytest.mark.unit
-    def test_get_edges(self):
+    def test_get_edges(self, new_repr):
         """Test getting all edges."""
-        adj_matrix = AdjacencyMatrix[str](directed=True)
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
+        rep = new_repr(directed=True)
+        rep.add_vertex("A")
+        rep.add_vertex("B")
 
-        assert not adj_matrix.get_edges()
+        assert not rep.get_edges()
 
-        adj_matrix.add_edge("A", "B", weight=2.0)
-        edges = adj_matrix.get_edges()
+        rep.add_edge("A", "B", weight=2.0)
+        edges = rep.get_edges()
         assert len(edges) == 1
         edge = next(iter(edges))  # Get the single edge from the set
         assert edge.source == "A"
@@ -571,37 +359,64 @@ class TestAdjacencyMatrix:
         assert edge.weight == 2.0
 
     @pytest.mark.unit
-    def test_get_neighbors(self):
+    @pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
+    def test_count_edges_matches_get_edges(self, new_repr, directed):
+        """Test count_edges() agrees with get_edges(), including self-loops."""
+        rep = new_repr(directed=directed)
+        rep.add_vertices(["A", "B", "C"])
+        assert rep.count_edges() == 0
+
+        rep.add_edges([("A", "B"), ("B", "A"), ("A", "A"), ("B", "C")])
+        assert rep.count_edges() == len(rep.get_edges()) == (4 if directed else 3)
+
+        rep.remove_vertex("B")
+        assert rep.count_edges() == len(rep.get_edges()) == 1
+
+    @pytest.mark.unit
+    def test_get_neighbors(self, new_repr):
         """Test getting neighbors of a vertex."""
-        adj_matrix = AdjacencyMatrix[str]()
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
-        adj_matrix.add_vertex("C")
+        rep = new_repr()
+        rep.add_vertex("A")
+        rep.add_vertex("B")
+        rep.add_vertex("C")
 
         # No neighbors initially
-        assert adj_matrix.get_neighbors("A") == set()
+        assert rep.get_neighbors("A") == set()
 
         # Add edges
-        adj_matrix.add_edge("A", "B")
-        adj_matrix.add_edge("A", "C")
-        assert adj_matrix.get_neighbors("A") == {"B", "C"}
+        rep.add_edge("A", "B")
+        rep.add_edge("A", "C")
+        assert rep.get_neighbors("A") == {"B", "C"}
 
         # Non-existent vertex
-        assert adj_matrix.get_neighbors("D") == set()
+        assert rep.get_neighbors("D") == set()
+
+    @pytest.mark.unit
+    def test_get_neighbors_after_vertex_removal(self, new_repr):
+        """Test neighbors stay correct once a vertex in the middle is removed."""
+        rep = new_repr(directed=True)
+        rep.add_vertices(["A", "B", "C", "D"])
+        rep.add_edges([("A", "B"), ("A", "C"), ("A", "D"), ("D", "C")])
+
+        rep.remove_vertex("B")
+
+        assert rep.get_neighbors("A") == {"C", "D"}
+        assert rep.get_neighbors("D") == {"C"}
+        assert rep.get_neighbors("C") == set()
 
     @pytest.mark.unit
-    def test_get_edge_data(self):
+    def test_get_edge_data(self, new_repr):
         """Test getting edge data."""
-        adj_matrix = AdjacencyMatrix[str]()
-        adj_matrix.add_vertex("A")
-        adj_matrix.add_vertex("B")
+        rep = new_repr()
+        rep.add_vertex("A")
+        rep.add_vertex("B")
 
         # Non-existent edge
-        assert adj_matrix.get_edge_data("A", "B") is None
+        assert rep.get_edge_data("A", "B") is None
 
         # Add edge and retrieve
-        adj_matrix.add_edge("A", "B", weight=1.5, metadata={"color": "red"})
-        edge = adj_matrix.get_edge_data("A", "B")
+        rep.add_edge("A", "B", weight=1.5, metadata={"color": "red"})
+        edge = rep.get_edge_data("A", "B")
         assert edge is not None
         assert edge.source == "A"
         assert edge.target == "B"
@@ -609,4 +424,53 @@ class TestAdjacencyMatrix:
         assert edge.metadata == {"color": "red"}
 
         # Non-existent vertices
-        assert adj_matrix.get_edge_data("C", "D") is None
+        assert rep.get_edge_data("C", "D") is None
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("directed", [True, False], ids=["directed", "undirected"])
+    def test_reorder_rcm_preserves_graph(self, new_repr, directed):
+        """Test that RCM reordering leaves vertices, edges and neighbours unchanged."""
+        rep = new_repr(directed=directed)
+        rep.add_vertices(["A", "B", "C", "D", "E", "F"])
+        rep.add_edges([("A", "D", 2.0), ("D", "B"), ("B", "E"), ("C", "F")])
+        rep.add_edge("E", "A", metadata={"color": "red"})
+        edges = rep.get_edges()
+        neighbors = {vertex: rep.get_neighbors(vertex) for vertex in rep.get_vertices()}
+
+        rep.reorder_rcm()
+
+        assert rep.get_vertices() == set(neighbors)
+        assert rep.get_edges() == edges
+        assert {vertex: rep.get_neighbors(vertex) for vertex in rep.get_vertices()} == neighbors
+        assert rep.get_edge_data("A", "D").weight == 2.0
+        assert rep.get_edge_data("E", "A").metadata == {"color": "red"}
+
+        # The representation stays fully usable after reordering
+        assert rep.remove_vertex("D")
+        assert rep.add_edge("A", "B")
+        assert rep.has_edge("A", "B")
+        assert not rep.has_edge("A", "D")
+
+    @pytest.mark.unit
+    def test_reorder_rcm_empty(self, new_repr):
+        """Test that reordering an empty representation is a no-op."""
+        rep = new_repr()
+        rep.reorder_rcm()
+        assert rep.get_vertices() == set()
+
+
+@pytest.mark.unit
+def test_reverse_cuthill_mckee_reduces_bandwidth():
+    """Test that RCM places neighbours of a scrambled path next to each other."""
+    # Path 0-4-2-5-1-3 with a separate component 6-7
+    path = [0, 4, 2, 5, 1, 3]
+    adjacency: list[set[int]] = [set() for _ in range(8)]
+    for u, v in [*zip(path, path[1:], strict=False), (6, 7)]:
+        adjacency[u].add(v)
+        adjacency[v].add(u)
+
+    order = _reverse_cuthill_mckee(adjacency)
+
+    assert sorted(order) == list(range(8))
+    position = {old: new for new, old in enumerate(order)}
+    assert max(abs(position[u] - position[v]) for u in range(8) for v in adjacency[u]) == 1
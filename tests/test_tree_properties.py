@@ -11,25 +11,80 @@ These tests follow the TDD methodology:
 - REFACTOR phase: Improve implementation while keeping tests green
 """
 
+import copy
+import functools
+from collections import Counter
+
 import pytest
-from hypothesis import given, settings
+from hypothesis import Phase, given, settings
 from hypothesis import strategies as st
 
-from pygraph.exceptions import CycleError
+from pygraph.exceptions import CycleError, InvalidGraphError
+from pygraph.graph import Graph
 from pygraph.tree import Tree
 
+# Strategy for test_property_trees_remain_acyclic, composed once at import
+# time rather than on every collection of the test.
+_VERTICES_STRATEGY = st.lists(st.integers(), min_size=3, max_size=10, unique=True)
+
+# Errors Tree.from_graph() raises for graphs that are not trees. InvalidGraphError
+# derives from GraphError rather than ValueError, so both classes are needed.
+_FROM_GRAPH_ERRORS = (ValueError, InvalidGraphError)
+
+
+@functools.lru_cache(maxsize=2048)
+def _build_tree(root, parent_child_pairs):
+    """Build a tree from (parent, child) pairs, memoized across Hypothesis examples.
+
+    Pairs are applied in order; a pair whose child is already in the tree or whose
+    parent is not yet in it is skipped. Returns the tree together with the pairs
+    that were actually added. The tree is shared
+    between calls, so callers must copy.deepcopy() it before mutating.
+    """
+    tree = Tree(root)
+    added_vertices = {root}
+    added_pairs = []
+
+    for parent, child in parent_child_pairs:
+        # These are the only ways add_child can reject a pair, so no try/except is needed
+        if child not in added_vertices and parent in added_vertices:
+            tree.add_child(parent, child)
+            added_vertices.add(child)
+            added_pairs.append((parent, child))
+
+    return tree, tuple(added_pairs)
+
+
+@functools.lru_cache(maxsize=4096)
+def _base_star(vertices, directed):
+    """Build a star graph with every other vertex a child of ``vertices[0]``, memoized.
+
+    The graph is shared between calls, so callers must copy.deepcopy() it before
+    mutating.
+    """
+    graph = Graph[int](directed=directed)
+    graph.add_vertices(vertices)
+    graph.add_edges((vertices[0], child) for child in vertices[1:])
+    return graph
+
+
+def _assert_unchanged(tree, num_vertices, num_edges):
+    """Assert a rejected operation left the tree's vertex and edge counts unchanged.
+
+    Plain tuple comparison lets pytest's assertion rewriting build the failure
+    message only when the check fails.
+    """
+    assert (tree.num_vertices(), tree.num_edges()) == (num_vertices, num_edges)
+
 
 @pytest.mark.property
-@settings(max_examples=100)
-@given(
-    vertices=st.lists(st.integers(), min_size=3, max_size=10, unique=True),
-    edge_pairs=st.lists(
-        st.tuples(st.integers(min_value=0, max_value=9), st.integers(min_value=0, max_value=9)),
-        min_size=2,
-        max_size=8,
-    ),
+@settings(
+    derandomize=True,
+    database=None,
+    phases=(Phase.generate, Phase.target),
 )
-def test_property_trees_remain_acyclic(vertices, edge_pairs):
+@given(vertices=_VERTICES_STRATEGY)
+def test_property_trees_remain_acyclic(vertices):
     """Property: Trees remain acyclic.
 
     Feature: graph-library, Property 17: For any tree and any attempt to add an edge
@@ -47,31 +102,27 @@ def test_property_trees_remain_acyclic(vertices, edge_pairs):
     create cycles. Each attempt should be rejected with a CycleError, and the
     tree should remain unchanged.
     """
-    # Skip if we don't have enough vertices to create a meaningful tree
-    if len(vertices) < 3:
-        return
-
     # Create a tree with the first vertex as root
     root = vertices[0]
-    tree = Tree(root)
 
     # Build a tree structure by adding parent-child relationships
     # We'll create a simple tree structure to ensure we have a valid tree first
-    added_vertices = {root}
-    parent_child_pairs = []
+    # added[i] is set once vertices[i] is in the tree (flat byte mask instead of a set)
+    added = bytearray(len(vertices))
+    added[0] = 1
+    candidate_pairs = []
 
     for i in range(1, min(len(vertices), 5)):
         parent = vertices[0]  # Use root as parent for simplicity
         child = vertices[i]
 
-        if child not in added_vertices:
-            try:
-                tree.add_child(parent, child)
-                added_vertices.add(child)
-                parent_child_pairs.append((parent, child))
-            except Exception:  # pylint: disable=broad-except
-                # Skip if add_child fails for any reason
-                continue
+        if not added[i]:
+            added[i] = 1
+            candidate_pairs.append((parent, child))
+
+    # The cached tree is shared across examples; copy it since this test mutates it
+    cached_tree, parent_child_pairs = _build_tree(root, tuple(candidate_pairs))
+    tree = copy.deepcopy(cached_tree)
 
     # Capture initial state before attempting to create cycle
     initial_vertex_count = tree.num_vertices()
@@ -85,19 +136,12 @@ def test_property_trees_remain_acyclic(vertices, edge_pairs):
         parent, child = parent_child_pairs[0]
 
         # Attempt to add edge from child to parent (would create cycle)
-        with pytest.raises(CycleError, match=".*cycle.*"):
+        with pytest.raises(CycleError) as exc_info:
             tree.add_child(child, parent)
+        assert "cycle" in str(exc_info.value).lower()
 
         # Verify tree state is unchanged
-        assert tree.num_vertices() == initial_vertex_count, (
-            f"Tree vertex count should be unchanged after rejected cycle creation. "
-            f"Initial: {initial_vertex_count}, Final: {tree.num_vertices()}"
-        )
-
-        assert tree.num_edges() == initial_edge_count, (
-            f"Tree edge count should be unchanged after rejected cycle creation. "
-            f"Initial: {initial_edge_count}, Final: {tree.num_edges()}"
-        )
+        _assert_unchanged(tree, initial_vertex_count, initial_edge_count)
 
     # Test Case 2: Try to add edge that creates a longer cycle
     # If we have at least 3 vertices in the tree, try to create a cycle
@@ -108,7 +152,8 @@ def test_property_trees_remain_acyclic(vertices, edge_pairs):
 
         # If child2 is different from parent1, try to add edge from child2 to parent1
         # This would create a cycle if there's a path from parent1 to child2
-        if child2 != parent1 and child2 in added_vertices:
+        # (every vertex in parent_child_pairs has already been added to the tree)
+        if child2 != parent1:
             # Capture state before attempt
             state_before_vertex_count = tree.num_vertices()
             state_before_edge_count = tree.num_edges()
@@ -123,15 +168,7 @@ def test_property_trees_remain_acyclic(vertices, edge_pairs):
             except CycleError:
                 # Expected: CycleError was raised
                 # Verify tree state is unchanged
-                assert tree.num_vertices() == state_before_vertex_count, (
-                    f"Tree vertex count should be unchanged after rejected cycle creation. "
-                    f"Before: {state_before_vertex_count}, After: {tree.num_vertices()}"
-                )
-
-                assert tree.num_edges() == state_before_edge_count, (
-                    f"Tree edge count should be unchanged after rejected cycle creation. "
-                    f"Before: {state_before_edge_count}, After: {tree.num_edges()}"
-                )
+                _assert_unchanged(tree, state_before_vertex_count, state_before_edge_count)
 
     # Test Case 3: Try to add a vertex that already exists as a child
     # (would create a cycle by having a vertex with two parents)
@@ -140,7 +177,7 @@ def test_property_trees_remain_acyclic(vertices, edge_pairs):
         parent2, child2 = parent_child_pairs[1]
 
         # Try to add child1 as a child of parent2 (child1 already has parent1 as parent)
-        if parent2 != parent1 and child1 in added_vertices:
+        if parent2 != parent1:
             state_before_vertex_count = tree.num_vertices()
             state_before_edge_count = tree.num_edges()
 
@@ -156,15 +193,7 @@ def test_property_trees_remain_acyclic(vertices, edge_pairs):
             except (CycleError, ValueError):
                 # Expected: Either CycleError or ValueError should be raised
                 # Verify tree state is unchanged
-                assert tree.num_vertices() == state_before_vertex_count, (
-                    f"Tree vertex count should be unchanged after rejected operation. "
-                    f"Before: {state_before_vertex_count}, After: {tree.num_vertices()}"
-                )
-
-                assert tree.num_edges() == state_before_edge_count, (
-                    f"Tree edge count should be unchanged after rejected operation. "
-                    f"Before: {state_before_edge_count}, After: {tree.num_edges()}"
-                )
+                _assert_unchanged(tree, state_before_vertex_count, state_before_edge_count)
 
     # Final verification: Tree should still be acyclic
     # We can verify this by checking that num_edges == num_vertices - 1
@@ -180,16 +209,8 @@ def test_property_trees_remain_acyclic(vertices, edge_pairs):
 
 
 @pytest.mark.property
-@settings(max_examples=100)
-@given(
-    vertices=st.lists(st.integers(), min_size=1, max_size=15, unique=True),
-    edge_indices=st.lists(
-        st.tuples(st.integers(min_value=0, max_value=14), st.integers(min_value=0, max_value=14)),
-        min_size=0,
-        max_size=10,
-    ),
-)
-def test_property_tree_to_graph_conversion_preserves_structure(vertices, edge_indices):
+@given(vertices=st.lists(st.integers(), min_size=1, max_size=15, unique=True), data=st.data())
+def test_property_tree_to_graph_conversion_preserves_structure(vertices, data):
     """Property: Tree to graph conversion preserves structure.
 
     Feature: graph-library, Property 18: For any tree, converting it to a graph
@@ -209,62 +230,61 @@ def test_property_tree_to_graph_conversion_preserves_structure(vertices, edge_in
     and verifies that the graph has the same vertices, edges, and structural
     properties as the original tree.
     """
-    # Skip if we don't have enough vertices
-    if len(vertices) < 1:
-        return
-
     # Create a tree with the first vertex as root
     root = vertices[0]
-    tree = Tree(root)
 
     # Build a tree structure by adding parent-child relationships
     # We'll create a valid tree by ensuring each child is added only once
     added_vertices = {root}
-    tree_edges = []  # Track edges as (parent, child) tuples
+    added_list = [root]  # Same vertices in insertion order, for sampling parents
+    candidate_pairs = []
 
-    # Add children to build the tree
-    for i in range(1, len(vertices)):
-        # Choose a parent from already added vertices
-        parent_idx = i % len(added_vertices)
-        parent = list(added_vertices)[parent_idx]
-        child = vertices[i]
+    # Choose children to build the tree
+    for child in vertices[1:]:
+        # Let Hypothesis choose (and shrink) the parent among already added vertices
+        parent = data.draw(st.sampled_from(added_list))
 
         if child not in added_vertices:
-            try:
-                tree.add_child(parent, child)
-                added_vertices.add(child)
-                tree_edges.append((parent, child))
-            except Exception:  # pylint: disable=broad-except
-                # Skip if add_child fails for any reason
-                continue
+            added_vertices.add(child)
+            added_list.append(child)
+            candidate_pairs.append((parent, child))
+
+    # The tree is only read below, so the cached instance is used directly
+    tree, added_pairs = _build_tree(root, tuple(candidate_pairs))
+    tree_edges = list(added_pairs)  # Track edges as (parent, child) tuples
 
     # Convert tree to graph
     graph = tree.to_graph()
 
-    # Property 1: All tree vertices should be in the graph
+    # Query each side once; the properties below only read these locals
     tree_vertices = tree.vertices()
     graph_vertices = graph.vertices()
+    tree_edge_set = tree.edges()
+    graph_edge_set = {(edge.source, edge.target) for edge in graph.edges()}
+    tree_num_vertices = tree.num_vertices()
+    graph_num_vertices = graph.num_vertices()
+    tree_num_edges = tree.num_edges()
+    graph_num_edges = graph.num_edges()
+
+    # Property 1: All tree vertices should be in the graph
 
     assert tree_vertices == graph_vertices, (
         f"Graph should have same vertices as tree. " f"Tree vertices: {tree_vertices}, Graph vertices: {graph_vertices}"
     )
 
     # Property 2: Vertex count should be preserved
-    assert tree.num_vertices() == graph.num_vertices(), (
-        f"Graph should have same vertex count as tree. " f"Tree: {tree.num_vertices()}, Graph: {graph.num_vertices()}"
+    assert tree_num_vertices == graph_num_vertices, (
+        f"Graph should have same vertex count as tree. " f"Tree: {tree_num_vertices}, Graph: {graph_num_vertices}"
     )
 
     # Property 3: All tree edges should be in the graph
-    tree_edge_set = tree.edges()
-    graph_edge_set = {(edge.source, edge.target) for edge in graph.edges()}
-
     assert tree_edge_set == graph_edge_set, (
         f"Graph should have same edges as tree. " f"Tree edges: {tree_edge_set}, Graph edges: {graph_edge_set}"
     )
 
     # Property 4: Edge count should be preserved
-    assert tree.num_edges() == graph.num_edges(), (
-        f"Graph should have same edge count as tree. " f"Tree: {tree.num_edges()}, Graph: {graph.num_edges()}"
+    assert tree_num_edges == graph_num_edges, (
+        f"Graph should have same edge count as tree. " f"Tree: {tree_num_edges}, Graph: {graph_num_edges}"
     )
 
     # Property 5: Graph should be directed (trees are represented as directed graphs)
@@ -277,10 +297,6 @@ def test_property_tree_to_graph_conversion_preserves_structure(vertices, edge_in
             f"Tree edges: {tree_edges}, Graph edges: {graph_edge_set}"
         )
 
-        # Verify the edge direction is correct (parent -> child, not child -> parent)
-        # In a tree, edges go from parent to child
-        assert graph.has_edge(parent, child), f"Graph should have directed edge from parent {parent} to child {child}"
-
     # Property 7: For each vertex (except root), verify parent relationship is preserved
     for vertex in tree_vertices:
         if vertex != root:
@@ -302,10 +318,10 @@ def test_property_tree_to_graph_conversion_preserves_structure(vertices, edge_in
         )
 
     # Property 9: Graph should maintain tree property (n vertices, n-1 edges)
-    if graph.num_vertices() > 0:
-        assert graph.num_edges() == graph.num_vertices() - 1, (
+    if graph_num_vertices > 0:
+        assert graph_num_edges == graph_num_vertices - 1, (
             f"Graph should maintain tree property: edges = vertices - 1. "
-            f"Vertices: {graph.num_vertices()}, Edges: {graph.num_edges()}"
+            f"Vertices: {graph_num_vertices}, Edges: {graph_num_edges}"
         )
 
     # Property 10: Graph should be acyclic (tree property)
@@ -315,24 +331,26 @@ def test_property_tree_to_graph_conversion_preserves_structure(vertices, edge_in
     # - For a tree: edges = vertices - 1
     # We've already verified edges = vertices - 1, which is a necessary condition
 
+    # Count incoming edges for every vertex in a single pass over the edges
+    # (the graph is directed, so each (source, target) pair is a distinct edge)
+    in_degree = Counter(target for _, target in graph_edge_set)
+
     # Additional verification: Each non-root vertex should have exactly one incoming edge
     for vertex in graph_vertices:
         if vertex != root:
-            # Count incoming edges
-            incoming_edges = sum(1 for edge in graph.edges() if edge.target == vertex)
+            incoming_edges = in_degree.get(vertex, 0)
             assert incoming_edges == 1, (
                 f"Non-root vertex {vertex} should have exactly one incoming edge, " f"but has {incoming_edges}"
             )
 
     # Root should have no incoming edges
-    root_incoming_edges = sum(1 for edge in graph.edges() if edge.target == root)
+    root_incoming_edges = in_degree.get(root, 0)
     assert root_incoming_edges == 0, (
         f"Root vertex {root} should have no incoming edges, " f"but has {root_incoming_edges}"
     )
 
 
 @pytest.mark.property
-@settings(max_examples=100)
 @given(
     vertices=st.lists(st.integers(), min_size=2, max_size=10, unique=True),
     directed=st.booleans(),
@@ -357,31 +375,13 @@ def test_property_graph_to_tree_validation(vertices, directed, create_cycle, mak
     succeeds only when all three constraints are met, and raises appropriate
     errors otherwise.
     """
-    from pygraph.exceptions import InvalidGraphError
-    from pygraph.graph import Graph
-
-    # Skip if we don't have enough vertices
-    if len(vertices) < 2:
-        return
-
     # Create a graph with the specified properties
     root = vertices[0]
-    graph = Graph[int](directed=directed)
 
-    # Add all vertices
-    for vertex in vertices:
-        graph.add_vertex(vertex)
-
-    # Build a tree-like structure first (connected, acyclic)
-    # Then modify it based on test parameters
-    added_edges = []
-
-    # Create a simple tree structure (each vertex connects to next)
-    for i in range(1, len(vertices)):
-        parent = vertices[0]  # All connect to root for simplicity
-        child = vertices[i]
-        graph.add_edge(parent, child)
-        added_edges.append((parent, child))
+    # Build a tree-like structure first (connected, acyclic): all vertices connect
+    # to the root. Copy the cached star since it is modified below.
+    graph = copy.deepcopy(_base_star(tuple(vertices), directed))
+    added_edges = [(root, child) for child in vertices[1:]]
 
     # Track if we actually created a cycle or disconnection
     actually_has_cycle = False
@@ -432,7 +432,7 @@ def test_property_graph_to_tree_validation(vertices, directed, create_cycle, mak
                     f"Tree should have vertices-1 edges. " f"Vertices: {tree.num_vertices()}, Edges: {tree.num_edges()}"
                 )
 
-        except (ValueError, InvalidGraphError) as e:
+        except _FROM_GRAPH_ERRORS as e:
             # If conversion failed when it should succeed, this is an error
             pytest.fail(
                 f"Tree.from_graph() should have succeeded for directed, acyclic, "
@@ -442,7 +442,7 @@ def test_property_graph_to_tree_validation(vertices, directed, create_cycle, mak
             )
     else:
         # Conversion should fail with appropriate error
-        with pytest.raises((ValueError, InvalidGraphError)):
+        with pytest.raises(_FROM_GRAPH_ERRORS):
             Tree.from_graph(graph, root)
 
         # Verify the error is raised (the with statement above handles this)
@@ -17,16 +17,53 @@ These tests follow the TDD methodology:
 - REFACTOR phase: Improve implementation while keeping tests green
 """
 
+import sys
+
 import pytest
 
-from pygraph.exceptions import CycleError, VertexNotFoundError
+from pygraph.exceptions import CycleError, InvalidGraphError, VertexNotFoundError
 from pygraph.graph import Graph
 from pygraph.protocols import GraphLike
 from pygraph.tree import Tree
 
 
+@pytest.fixture(scope="module")
+def single_vertex_tree():
+    """Root-only tree ``Tree("A")`` shared by the read-only tests in this module.
+
+    Tests using this fixture must not mutate the tree; teardown fails if they did.
+    """
+    tree = Tree("A")
+    yield tree
+    assert tree.num_vertices() == 1 and tree.num_edges() == 0, "single_vertex_tree fixture was mutated by a test"
+
+
+@pytest.fixture(scope="module")
+def complex_tree_graph():
+    r"""Directed graph of a seven-vertex tree shared by the read-only from_graph tests.
+
+    ::
+
+              A
+             / \
+            B   C
+           / \   \
+          D   E   F
+         /
+        G
+
+    Trees built from it adopt the graph, so tests must not mutate those trees;
+    teardown fails if the graph changed.
+    """
+    graph = Graph[str](directed=True)
+    graph.add_vertices(["A", "B", "C", "D", "E", "F", "G"])
+    graph.add_edges([("A", "B"), ("A", "C"), ("B", "D"), ("B", "E"), ("C", "F"), ("D", "G")])
+    yield graph
+    assert graph.num_vertices() == 7 and graph.num_edges() == 6, "complex_tree_graph fixture was mutated by a test"
+
+
 @pytest.mark.unit
-def test_tree_initialization_with_root():
+def test_tree_initialization_with_root(single_vertex_tree):
     """Test Tree(root) creates tree with single root vertex.
 
     This test verifies that when a Tree is created with a root vertex,
@@ -34,9 +71,8 @@ def test_tree_initialization_with_root():
 
     Expected in RED phase: Test FAILS (Tree class doesn't exist yet)
     """
-    # Create a tree with a root vertex
     root = "A"
-    tree = Tree(root)
+    tree = single_vertex_tree
 
     # Verify the tree has exactly one vertex (the root)
     assert tree.num_vertices() == 1, f"Tree should have 1 vertex (root), got {tree.num_vertices()}"
@@ -51,9 +87,13 @@ def test_tree_initialization_with_root():
     vertices = tree.to_graph().vertices()
     assert root in vertices, f"Root {root} should be in tree vertices"
 
+    # Tree uses __slots__, so instances carry no attribute dict
+    assert not hasattr(tree, "__dict__"), "Tree instances should not have a __dict__"
+
 
 @pytest.mark.unit
-def test_tree_initialization_with_different_types():
+@pytest.mark.parametrize("root", ["root", 42, (1, 2, 3)], ids=["str", "int", "tuple"])
+def test_tree_initialization_with_different_types(root):
     """Test Tree can be initialized with different hashable types.
 
     This test verifies that Tree supports various hashable types as vertices,
@@ -61,24 +101,13 @@ def test_tree_initialization_with_different_types():
 
     Expected in RED phase: Test FAILS (Tree class doesn't exist yet)
     """
-    # Test with string root
-    tree_str = Tree("root")
-    assert tree_str.root == "root"
-    assert tree_str.num_vertices() == 1
-
-    # Test with integer root
-    tree_int = Tree(42)
-    assert tree_int.root == 42
-    assert tree_int.num_vertices() == 1
-
-    # Test with tuple root (hashable)
-    tree_tuple = Tree((1, 2, 3))
-    assert tree_tuple.root == (1, 2, 3)
-    assert tree_tuple.num_vertices() == 1
+    tree = Tree(root)
+    assert tree.root == root
+    assert tree.num_vertices() == 1
 
 
 @pytest.mark.unit
-def test_tree_implements_graphlike_protocol():
+def test_tree_implements_graphlike_protocol(single_vertex_tree):
     """Test Tree implements GraphLike protocol.
 
     This test verifies that Tree implements all required methods of the
@@ -86,29 +115,14 @@ def test_tree_implements_graphlike_protocol():
 
     Expected in RED phase: Test FAILS (Tree class doesn't exist yet)
     """
-    # Create a tree
-    tree = Tree("root")
+    tree = single_vertex_tree
 
-    # Verify Tree is recognized as GraphLike
+    # Verify Tree is recognized as GraphLike (runtime_checkable checks every protocol method)
     assert isinstance(tree, GraphLike), "Tree should implement GraphLike protocol"
 
-    # Verify Tree has all required GraphLike methods
-    assert hasattr(tree, "vertices"), "Tree should have vertices() method"
-    assert hasattr(tree, "edges"), "Tree should have edges() method"
-    assert hasattr(tree, "neighbors"), "Tree should have neighbors() method"
-    assert hasattr(tree, "has_edge"), "Tree should have has_edge() method"
-    assert hasattr(tree, "to_graph"), "Tree should have to_graph() method"
-
-    # Verify methods are callable
-    assert callable(tree.vertices), "vertices() should be callable"
-    assert callable(tree.edges), "edges() should be callable"
-    assert callable(tree.neighbors), "neighbors() should be callable"
-    assert callable(tree.has_edge), "has_edge() should be callable"
-    assert callable(tree.to_graph), "to_graph() should be callable"
-
 
 @pytest.mark.unit
-def test_tree_to_graph_returns_valid_graph():
+def test_tree_to_graph_returns_valid_graph(single_vertex_tree):
     """Test to_graph() returns valid Graph.
 
     This test verifies that the to_graph() method returns a valid Graph
@@ -116,15 +130,15 @@ def test_tree_to_graph_returns_valid_graph():
 
     Expected in RED phase: Test FAILS (Tree class doesn't exist yet)
     """
-    # Create a tree with a root
     root = "A"
-    tree = Tree(root)
+    tree = single_vertex_tree
 
     # Get the graph representation
     graph = tree.to_graph()
 
     # Verify it's a Graph instance
     assert isinstance(graph, Graph), f"to_graph() should return a Graph instance, got {type(graph)}"
+    assert tree.to_graph() is graph, "to_graph() should return the internal graph without copying"
 
     # Verify the graph has the same vertices as the tree
     assert root in graph.vertices(), f"Graph should contain root vertex {root}"
@@ -141,7 +155,7 @@ def test_tree_to_graph_returns_valid_graph():
 
 
 @pytest.mark.unit
-def test_tree_graphlike_methods_work():
+def test_tree_graphlike_methods_work(single_vertex_tree):
     """Test GraphLike protocol methods work on Tree.
 
     This test verifies that the GraphLike protocol methods (vertices, edges,
@@ -149,9 +163,8 @@ def test_tree_graphlike_methods_work():
 
     Expected in RED phase: Test FAILS (Tree class doesn't exist yet)
     """
-    # Create a tree with a root
     root = "A"
-    tree = Tree(root)
+    tree = single_vertex_tree
 
     # Test vertices() method (via to_graph)
     graph = tree.to_graph()
@@ -176,7 +189,7 @@ def test_tree_graphlike_methods_work():
 
 
 @pytest.mark.unit
-def test_tree_num_vertices_and_num_edges():
+def test_tree_num_vertices_and_num_edges(single_vertex_tree):
     """Test num_vertices() and num_edges() methods.
 
     This test verifies that Tree provides num_vertices() and num_edges()
@@ -184,18 +197,12 @@ def test_tree_num_vertices_and_num_edges():
 
     Expected in RED phase: Test FAILS (Tree class doesn't exist yet)
     """
-    # Create a tree with a root
-    root = "A"
-    tree = Tree(root)
+    tree = single_vertex_tree
 
     # Test num_vertices()
-    assert hasattr(tree, "num_vertices"), "Tree should have num_vertices() method"
-    assert callable(tree.num_vertices), "num_vertices() should be callable"
     assert tree.num_vertices() == 1, f"Tree should have 1 vertex, got {tree.num_vertices()}"
 
     # Test num_edges()
-    assert hasattr(tree, "num_edges"), "Tree should have num_edges() method"
-    assert callable(tree.num_edges), "num_edges() should be callable"
     assert tree.num_edges() == 0, f"Tree should have 0 edges, got {tree.num_edges()}"
 
 
@@ -410,6 +417,94 @@ def test_add_child_raises_cycle_error_if_cycle_would_be_created():
     assert tree.parent("A") is None, "A should still be the root with no parent"
 
 
+@pytest.mark.unit
+def test_add_child_raises_cycle_error_for_second_parent_or_self_loop():
+    """Test add_child rejects giving an existing vertex a second parent or itself as child.
+
+    Attaching an existing non-ancestor vertex under another parent would give it
+    two parents; the error names its current parent. A self-loop is a cycle.
+    """
+    tree = Tree("A")
+    tree.add_child("A", "B")
+    tree.add_child("A", "C")
+    tree.add_child("B", "D")
+
+    with pytest.raises(CycleError) as exc_info:
+        tree.add_child("C", "D")
+    assert "cycle" in str(exc_info.value).lower()
+    assert "already has parent B" in str(exc_info.value)
+
+    with pytest.raises(CycleError) as exc_info:
+        tree.add_child("D", "D")
+    assert "already has parent" not in str(exc_info.value)
+
+    assert tree.num_vertices() == 4
+    assert tree.parent("D") == "B"
+
+
+@pytest.mark.unit
+def test_bulk_add_children_builds_tree_and_is_atomic():
+    """Test bulk_add_children matches repeated add_child and rolls back on errors.
+
+    Edges may reference children added earlier in the same batch. A rejected
+    edge anywhere in the batch leaves the tree unchanged.
+    """
+    tree = Tree("A")
+    tree.bulk_add_children([("A", "B"), ("B", "C"), ("A", "D")])
+    tree.bulk_add_children([])
+
+    expected = Tree("A")
+    for parent, child in [("A", "B"), ("B", "C"), ("A", "D")]:
+        expected.add_child(parent, child)
+    assert tree.edges() == expected.edges()
+    assert tree.num_vertices() == 4
+    assert tree.num_edges() == 3
+    assert tree.depth("C") == 2
+    assert tree.height() == 2
+
+    bad_batches = [
+        ([("A", "E"), ("X", "F")], VertexNotFoundError),
+        ([("A", "E"), ("A", "E")], ValueError),
+        ([("D", "B")], CycleError),
+        ([("C", "A")], CycleError),
+    ]
+    for batch, error in bad_batches:
+        with pytest.raises(error):
+            tree.bulk_add_children(batch)
+        assert tree.num_vertices() == 4
+        assert tree.edges() == expected.edges()
+        assert tree.children("A") == {"B", "D"}
+        assert "E" not in tree.vertices()
+        assert tree.to_graph().num_vertices() == 4
+
+    tree.bulk_add_children([("A", "E")])
+    assert tree.height() == 2
+
+
+@pytest.mark.unit
+def test_string_vertices_are_interned_on_insertion():
+    """Test that dynamically built string vertices are stored interned.
+
+    Strings created at runtime are not interned automatically; the tree
+    interns them so stored keys are shared with equal interned strings.
+    """
+    root = "".join(["ro", "ot"])
+    child = "".join(["chi", "ld"])
+    other = "".join(["oth", "er"])
+    tree = Tree(root)
+    tree.add_child("".join(["ro", "ot"]), child)
+    tree.bulk_add_children([("".join(["chi", "ld"]), other)])
+
+    stored = {vertex: vertex for vertex in tree.vertices()}
+    assert stored["root"] is sys.intern("root") and tree.root is stored["root"]
+    assert stored["child"] is sys.intern("child")
+    assert stored["other"] is sys.intern("other")
+    # Parent references share the stored key objects, not the caller's copies
+    assert tree.parent("child") is stored["root"]
+    assert tree.parent("other") is stored["child"]
+    assert {(p is stored[p], c is stored[c]) for p, c in tree.edges()} == {(True, True)}
+
+
 # REMOVED: test_add_child_cycle_detection_complex - duplicate of test_add_child_raises_cycle_error_if_cycle_would_be_created
 
 
@@ -586,6 +681,7 @@ def test_remove_subtree_with_deep_nesting():
     tree.add_child("B", "C")
     tree.add_child("C", "D")
     tree.add_child("D", "E")
+    vertices = tree.vertices()
 
     # Remove subtree rooted at B (should remove B, C, D, E)
     tree.remove_subtree("B")
@@ -595,9 +691,28 @@ def test_remove_subtree_with_deep_nesting():
     assert tree.num_edges() == 0, f"Tree should have 0 edges, got {tree.num_edges()}"
     assert "A" in tree.vertices(), "A should still be in tree"
 
-    # Verify all descendants are removed
+    # Verify all descendants are removed (vertices() is a live view)
+    assert vertices == {"A"}, f"Vertices view should only contain A, got {set(vertices)}"
     for vertex in ["B", "C", "D", "E"]:
-        assert vertex not in tree.vertices(), f"{vertex} should be removed from tree"
+        assert vertex not in vertices, f"{vertex} should be removed from tree"
+
+
+@pytest.mark.unit
+def test_iter_descendants_streams_subtree_in_preorder():
+    """Test _iter_descendants yields a vertex and its descendants lazily.
+
+    Parents come before their children, vertices outside the subtree are
+    never yielded, and walking from the root reaches every vertex.
+    """
+    tree = Tree("A")
+    tree.bulk_add_children([("A", "B"), ("B", "C"), ("C", "D"), ("A", "E")])
+
+    walk = tree._iter_descendants("B")  # pylint: disable=protected-access
+    assert next(walk) == "B", "The subtree root should be yielded first"
+    assert list(walk) == ["C", "D"], "Descendants should follow in depth-first order"
+
+    assert sorted(tree._iter_descendants("A")) == sorted(tree.vertices())  # pylint: disable=protected-access
+    assert list(tree._iter_descendants("E")) == ["E"]  # pylint: disable=protected-access
 
 
 # ============================================================================
@@ -653,6 +768,11 @@ def test_children_returns_all_children_of_node():
     children_e = tree.children("E")
     assert children_e == set(), f"Children of E should be empty set, got {children_e}"
 
+    # children() returns the live internal set, not a per-call copy
+    assert tree.children("A") is children_a
+    tree.add_child("E", "F")
+    assert children_e == {"F"}
+
 
 @pytest.mark.unit
 def test_is_leaf_correctly_identifies_leaf_nodes():
@@ -847,6 +967,25 @@ def test_height_with_unbalanced_tree():
     assert tree.height() == 3, "Height of unbalanced tree should be 3"
 
 
+@pytest.mark.unit
+def test_height_updates_after_tree_modifications():
+    """Test height() stays correct across add_child and remove_subtree calls."""
+    tree = Tree("A")
+    tree.add_child("A", "B")
+    assert tree.height() == 1
+    assert tree.height() == 1  # Served from the cache
+
+    tree.add_child("B", "C")
+    tree.add_child("C", "D")
+    assert tree.height() == 3
+
+    tree.remove_subtree("C")
+    assert tree.height() == 1
+
+    tree.remove_subtree("A")
+    assert tree.height() == 0
+
+
 @pytest.mark.unit
 def test_depth_with_multiple_children():
     """Test depth() with nodes having multiple children.
@@ -911,29 +1050,38 @@ def test_from_graph_with_valid_directed_graph():
 
 
 @pytest.mark.unit
-def test_depth_with_disconnected_vertex_raises_error():
-    """Test depth() raises error for vertex not connected to root.
-
-    This test covers the error case in depth() where a vertex
-    is not connected to the root (which shouldn't happen in a valid tree,
-    but we test the error handling).
+def test_depth_after_remove_subtree_and_from_graph():
+    """Test depth() stays correct after removals and for trees built from graphs.
 
-    Note: This is a theoretical edge case that shouldn't occur in practice
-    with the current Tree implementation, but we test it for completeness.
+    Depths are recorded when vertices are added rather than computed by
+    walking parents, so removed vertices must be forgotten and from_graph()
+    must record depths for every vertex, along with the resulting height.
     """
-    # Create a tree
     tree = Tree("A")
     tree.add_child("A", "B")
+    tree.add_child("B", "C")
+    tree.add_child("A", "D")
 
-    # Manually break the parent map to simulate a disconnected vertex
-    # This is the only way to trigger the ValueError in depth()
-    tree._parent_map["B"] = None  # pylint: disable=protected-access
+    tree.remove_subtree("B")
+    assert tree.depth("D") == 1
+    with pytest.raises(VertexNotFoundError):
+        tree.depth("C")
 
-    # Now depth("B") should raise ValueError
-    with pytest.raises(ValueError) as exc_info:
-        tree.depth("B")
+    # Re-adding a removed vertex elsewhere records its new depth
+    tree.add_child("D", "C")
+    assert tree.depth("C") == 2
 
-    assert "not connected to root" in str(exc_info.value)
+    graph = Graph[str](directed=True)
+    graph.add_vertices(["A", "B", "C", "D"])
+    graph.add_edges([("A", "B"), ("B", "C"), ("C", "D")])
+    tree_from_graph = Tree.from_graph(graph, "A")
+    assert tree_from_graph.to_graph() is graph
+    assert [tree_from_graph.depth(v) for v in "ABCD"] == [0, 1, 2, 3]
+
+    # from_graph() primes the height cache, which add_child keeps current
+    assert tree_from_graph.height() == 3
+    tree_from_graph.add_child("D", "E")
+    assert tree_from_graph.height() == 4
 
 
 @pytest.mark.unit
@@ -959,6 +1107,11 @@ def test_tree_edges_method_returns_edge_tuples():
     expected_edges = {("A", "B"), ("A", "C"), ("B", "D")}
     assert edges == expected_edges, f"Expected {expected_edges}, got {edges}"
 
+    # Removing a subtree drops its edges, including the one from its parent
+    tree.remove_subtree("B")
+    assert tree.edges() == {("A", "C")}, f"Expected only (A, C) after removal, got {tree.edges()}"
+    assert not tree.has_edge("A", "B") and not tree.has_edge("B", "D")
+
 
 @pytest.mark.unit
 def test_tree_neighbors_method_returns_children():
@@ -1009,8 +1162,6 @@ def test_from_graph_validation_errors():
 
     **Validates: Requirements A2.6** - Graph to tree conversion validates constraints
     """
-    from pygraph.exceptions import InvalidGraphError
-
     # Test 1: Undirected graph should be rejected
     graph_undirected = Graph[str](directed=False)
     graph_undirected.add_vertex("A")
@@ -1056,12 +1207,61 @@ def test_from_graph_validation_errors():
     graph_extra_edge.add_edge("A", "C")
     graph_extra_edge.add_edge("B", "C")  # Extra edge
 
-    with pytest.raises(InvalidGraphError, match="does not have tree property"):
+    with pytest.raises(InvalidGraphError, match="too many edges for a tree"):
         Tree.from_graph(graph_extra_edge, "A")
 
 
 @pytest.mark.unit
-def test_from_graph_builds_correct_parent_map():
+def test_from_graph_classifies_revisited_vertices():
+    """Test from_graph() tells cycles apart from vertices with two parents.
+
+    Graphs with the wrong edge count are rejected before any traversal, so
+    these graphs have n-1 edges and an unreachable vertex. The BFS still
+    reports an edge back to an ancestor (including a self-loop) as a cycle,
+    and an edge into an already reached non-ancestor as a tree-property
+    violation.
+    """
+    back_edge = Graph[str](directed=True)
+    back_edge.add_vertices(["A", "B", "C", "D"])
+    back_edge.add_edges([("A", "B"), ("B", "C"), ("C", "B")])
+    with pytest.raises(ValueError, match="cycles"):
+        Tree.from_graph(back_edge, "A")
+
+    self_loop = Graph[str](directed=True)
+    self_loop.add_vertices(["A", "B", "C"])
+    self_loop.add_edges([("A", "B"), ("B", "B")])
+    with pytest.raises(ValueError, match="cycles"):
+        Tree.from_graph(self_loop, "A")
+
+    second_parent = Graph[str](directed=True)
+    second_parent.add_vertices(["A", "B", "C", "D", "E"])
+    second_parent.add_edges([("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")])
+    with pytest.raises(InvalidGraphError, match="D is reachable from both"):
+        Tree.from_graph(second_parent, "A")
+
+    # With n-1 edges spent on a cycle elsewhere, the BFS finishes without reaching it
+    unreachable_cycle = Graph[str](directed=True)
+    unreachable_cycle.add_vertices(["A", "B", "C"])
+    unreachable_cycle.add_edges([("B", "C"), ("C", "B")])
+    with pytest.raises(ValueError, match="not reachable"):
+        Tree.from_graph(unreachable_cycle, "A")
+
+    # Too few edges fail before the traversal
+    too_few_edges = Graph[str](directed=True)
+    too_few_edges.add_vertices(["A", "B", "C"])
+    too_few_edges.add_edge("A", "B")
+    with pytest.raises(ValueError, match="need at least 2 edges"):
+        Tree.from_graph(too_few_edges, "A")
+
+    # A missing root is reported before the edge counts are compared
+    with pytest.raises(VertexNotFoundError):
+        Tree.from_graph(second_parent, "Z")
+    with pytest.raises(VertexNotFoundError):
+        Tree.from_graph(Graph[str](directed=True), "A")
+
+
+@pytest.mark.unit
+def test_from_graph_builds_correct_parent_map(complex_tree_graph):
     """Test Tree.from_graph() builds correct _parent_map.
 
     This test verifies that from_graph() correctly builds the internal
@@ -1069,20 +1269,8 @@ def test_from_graph_builds_correct_parent_map():
 
     **Validates: Requirements A2.6** - Graph to tree conversion
     """
-    # Create a directed graph that forms a tree structure
-    graph = Graph[str](directed=True)
-    graph.add_vertex("A")
-    graph.add_vertex("B")
-    graph.add_vertex("C")
-    graph.add_vertex("D")
-    graph.add_vertex("E")
-    graph.add_edge("A", "B")
-    graph.add_edge("A", "C")
-    graph.add_edge("B", "D")
-    graph.add_edge("B", "E")
-
-    # Convert to tree
-    tree = Tree.from_graph(graph, "A")
+    # Convert the shared tree-shaped graph
+    tree = Tree.from_graph(complex_tree_graph, "A")
 
     # Verify parent map is built correctly
     assert tree.parent("A") is None, "Root should have no parent"
@@ -1100,7 +1288,7 @@ def test_from_graph_builds_correct_parent_map():
 
 
 @pytest.mark.unit
-def test_from_graph_with_complex_tree_structure():
+def test_from_graph_with_complex_tree_structure(complex_tree_graph):
     """Test Tree.from_graph() with a more complex tree structure.
 
     This test verifies that from_graph() correctly handles larger, more
@@ -1108,32 +1296,8 @@ def test_from_graph_with_complex_tree_structure():
 
     **Validates: Requirements A2.5, A2.6** - Tree-Graph conversion
     """
-    # Create a directed graph with a complex tree structure
-    #       A
-    #      / \
-    #     B   C
-    #    / \   \
-    #   D   E   F
-    #  /
-    # G
-    graph = Graph[str](directed=True)
-    vertices = ["A", "B", "C", "D", "E", "F", "G"]
-    for v in vertices:
-        graph.add_vertex(v)
-
-    edges = [
-        ("A", "B"),
-        ("A", "C"),
-        ("B", "D"),
-        ("B", "E"),
-        ("C", "F"),
-        ("D", "G"),
-    ]
-    for source, target in edges:
-        graph.add_edge(source, target)
-
-    # Convert to tree
-    tree = Tree.from_graph(graph, "A")
+    # Convert the shared seven-vertex graph (see the complex_tree_graph fixture)
+    tree = Tree.from_graph(complex_tree_graph, "A")
 
     # Verify tree structure
     assert tree.root == "A"
@@ -1165,6 +1329,27 @@ def test_from_graph_with_complex_tree_structure():
     assert tree.depth("G") == 3
 
 
+@pytest.mark.unit
+def test_children_view_reflects_later_modifications():
+    """Test that a set returned by children() stays live, as documented.
+
+    children() hands out the stored child set, so a reference taken earlier
+    sees later add_child and remove_subtree calls, also for a tree built by
+    from_graph().
+    """
+    graph = Graph[str](directed=True)
+    graph.add_vertices(["A", "B", "C"])
+    graph.add_edges([("A", "B"), ("B", "C")])
+    tree = Tree.from_graph(graph, "A")
+
+    children_a = tree.children("A")
+    tree.add_child("A", "D")
+    assert children_a == {"B", "D"}, "Earlier children() result should include a later child"
+
+    tree.remove_subtree("B")
+    assert children_a == {"D"}, "Earlier children() result should drop a removed subtree"
+
+
 @pytest.mark.unit
 def test_from_graph_with_single_vertex():
     """Test Tree.from_graph() with a graph containing a single vertex.
@@ -1197,39 +1382,3 @@ def test_from_graph_with_single_vertex():
 
 # REMOVED: test_from_graph_with_tree_property_violation - consolidated into test_from_graph_validation_errors
 # REMOVED: test_from_graph_validates_connectivity_from_root - consolidated into test_from_graph_validation_errors
-
-
-@pytest.mark.unit
-def test_build_parent_map_with_already_visited_neighbor():
-    """Test _build_parent_map when a neighbor has already been visited.
-
-    This tests the branch where neighbor is already in visited_bfs.
-    In a valid tree, this shouldn't happen, but we test the method's robustness.
-    """
-    # Create a graph that looks like a tree but has an extra edge
-    # that creates a diamond pattern: A -> B, A -> C, B -> D, C -> D
-    # When building parent map from A, D will be visited from B first,
-    # then when we process C, D is already visited
-    graph = Graph[str](directed=True)
-    graph.add_vertex("A")
-    graph.add_vertex("B")
-    graph.add_vertex("C")
-    graph.add_vertex("D")
-    graph.add_edge("A", "B")
-    graph.add_edge("A", "C")
-    graph.add_edge("B", "D")
-    graph.add_edge("C", "D")  # This creates multiple paths to D
-
-    # Call the static method directly
-    parent_map = Tree._build_parent_map(graph, "A")
-
-    # D should have a parent (either B or C, depending on BFS order)
-    assert "D" in parent_map
-    assert parent_map["D"] in ["B", "C"]
-
-    # B and C should have A as parent
-    assert parent_map["B"] == "A"
-    assert parent_map["C"] == "A"
-
-    # A should not be in parent_map (it's the root)
-    assert "A" not in parent_map